@@ -8,10 +8,12 @@ from aiogram.enums import ParseMode
 from aiogram.fsm.storage.redis import RedisStorage
 from redis.asyncio.client import Redis
 
+from cache import OrderCounters, UserCache
 from config import Config, load_config
-from database import DefaultDatabase, PostgresDatabase
+from database import DefaultDatabase, PartitionManager, PostgresDatabase
+from fsm import CachedRedisStorage
 from handlers import admin_router, commands_router, order_router
-from keyboards import setup_menu
+from keyboards import calendar_keyboards, FrozenMarkupSession, setup_menu
 from logger import get_logger
 from middleware import setup as setup_middlewares
 from repository import OrderRepository, UserRepository
@@ -24,6 +26,7 @@ async def shutdown(
     logger: logging.Logger,
     redis: Redis | None,
     db: DefaultDatabase,
+    tasks: list[asyncio.Task],
 ) -> None:
     """
     Gracefully shutdown bot and resources.
@@ -31,6 +34,11 @@ async def shutdown(
 
     logger.info("Shutting down bot...")
 
+    logger.debug("Stopping background tasks...")
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
     logger.debug("Closing storage...")
     await dp.fsm.storage.close()
     if redis:
@@ -46,6 +54,11 @@ async def shutdown(
         logger.error("Failed to close bot session: %s", str(e))
 
     logger.debug("Closing database connection...")
+    logger.debug("Database pool: %s", db.pool_stats())
+    for name in ("user_service", "order_service"):
+        service = dp.workflow_data.get(name)
+        if service is not None:
+            logger.debug("Single-flight %s: %s", name, service.flights.stats())
     try:
         await db.close()
     except Exception as e:
@@ -69,10 +82,13 @@ async def main() -> None:
     except Exception as e:
         logger.fatal("Storage initialization failed: %s", str(e))
         return
-    storage = RedisStorage(redis=redis)
+    if config.fsm_cache.enabled:
+        storage = CachedRedisStorage(redis=redis, local_size=config.fsm_cache.size, local_ttl=config.fsm_cache.ttl)
+    else:
+        storage = RedisStorage(redis=redis)
 
     logger.debug("Connecting to the database...")
-    db = PostgresDatabase(config=config.postgres)
+    db = PostgresDatabase(config=config.postgres, logger=logger)
     try:
         await db.init_db()
     except Exception as e:
@@ -81,7 +97,11 @@ async def main() -> None:
 
     logger.debug("Initializing the bot...")
     try:
-        bot = Bot(token=config.bot.bot_token, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+        bot = Bot(
+            token=config.bot.bot_token,
+            session=FrozenMarkupSession(),
+            default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+        )
         dp = Dispatcher(storage=storage)
     except Exception as e:
         logger.fatal("Bot initialization failed: %s", str(e))
@@ -94,13 +114,16 @@ async def main() -> None:
         await setup_menu(bot)
     except Exception as e:
         logger.fatal("Menu loading failed: %s", str(e))
+    calendar_keyboards.warm()
 
     logger.debug("Registering repositories...")
-    user_repository = UserRepository(db)
-    order_reposiitory = OrderRepository(db)
+    user_cache = UserCache(redis, config.user_cache, logger)
+    user_repository = UserRepository(db, cache=user_cache)
+    order_counters = OrderCounters(redis, logger)
+    order_reposiitory = OrderRepository(db, counters=order_counters)
 
     logger.debug("Registering services...")
-    user_service = UserService(user_repository, logger)
+    user_service = UserService(user_repository, logger, cache=user_cache)
     dp.workflow_data["user_service"] = user_service
     order_service = OrderService(order_reposiitory, logger)
     dp.workflow_data["order_service"] = order_service
@@ -111,7 +134,16 @@ async def main() -> None:
     dp.include_router(admin_router)
 
     logger.debug("Registering middlewares...")
-    setup_middlewares(dp, logger, user_service=user_service)
+    setup_middlewares(dp, logger, user_service=user_service, database=db if config.bot.unit_of_work else None)
+
+    logger.debug("Starting background tasks...")
+    tasks = [
+        asyncio.create_task(user_cache.listen()),
+        asyncio.create_task(order_service.reconcile_counters(config.order_counters.reconcile_interval)),
+        asyncio.create_task(PartitionManager(db, logger).maintain()),
+        asyncio.create_task(order_service.run_archiver(config.order_archive)),
+        asyncio.create_task(calendar_keyboards.run(logger)),
+    ]
 
     # Graceful shutdown handling
     try:
@@ -120,7 +152,7 @@ async def main() -> None:
     except Exception as e:
         logger.fatal("An error occurred: %s", e)
     finally:
-        await shutdown(bot, dp, logger, redis, db)
+        await shutdown(bot, dp, logger, redis, db, tasks)
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ from sqlalchemy import pool
 
 from config import load_config
 from database import Base
-from models import Order, User  # noqa: F401
+from models import Order, OrderArchive, User  # noqa: F401
 
 
 db_config = load_config()
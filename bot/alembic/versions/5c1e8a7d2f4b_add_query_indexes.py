@@ -0,0 +1,58 @@
+"""add_query_indexes
+
+Revision ID: 5c1e8a7d2f4b
+Revises: 114977bc68a1
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e8a7d2f4b"
+down_revision: Union[str, None] = "114977bc68a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Индексы строятся без блокировки записи, поэтому вне транзакции
+    with op.get_context().autocommit_block():
+        # OrderRepository.get_pending / get_pending_page: WHERE status = 'pending' ORDER BY time, id
+        op.create_index(
+            "ix_orders_pending_time_id",
+            "orders",
+            ["time", "id"],
+            unique=False,
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+        )
+        # OrderRepository.get_by_author: WHERE author_id = ? ORDER BY id DESC
+        op.create_index(
+            "ix_orders_author_id_id",
+            "orders",
+            ["author_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # UserRepository.get_by_username (scripts.py)
+        op.create_index(
+            "ix_users_username",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_users_username", table_name="users", postgresql_concurrently=True)
+        op.drop_index("ix_orders_author_id_id", table_name="orders", postgresql_concurrently=True)
+        op.drop_index("ix_orders_pending_time_id", table_name="orders", postgresql_concurrently=True)
@@ -0,0 +1,105 @@
+"""partition_orders_by_time
+
+Revision ID: 7b3d9e2a4c61
+Revises: 5c1e8a7d2f4b
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database import add_months
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b3d9e2a4c61"
+down_revision: Union[str, None] = "5c1e8a7d2f4b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 12
+COLUMNS = "id, author_id, address, time, status, created_at"
+
+
+def create_indexes() -> None:
+    op.create_index(
+        "ix_orders_pending_time_id",
+        "orders",
+        ["time", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index("ix_orders_author_id_id", "orders", ["author_id", "id"], unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Таблица копируется целиком под блокировкой — выполнять в окно обслуживания
+    op.drop_index("ix_orders_author_id_id", table_name="orders")
+    op.drop_index("ix_orders_pending_time_id", table_name="orders")
+    op.execute("ALTER TABLE orders RENAME TO orders_unpartitioned")
+    op.execute("ALTER TABLE orders_unpartitioned RENAME CONSTRAINT orders_pkey TO orders_unpartitioned_pkey")
+
+    # Ключ секционирования обязан входить в первичный ключ; id по-прежнему выдаёт последовательность
+    op.execute(
+        """
+        CREATE TABLE orders (
+            id INTEGER NOT NULL DEFAULT nextval('orders_id_seq'::regclass),
+            author_id VARCHAR(20) NOT NULL REFERENCES users (id),
+            address VARCHAR(255) NOT NULL,
+            time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            status orderstatus NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT orders_pkey PRIMARY KEY (id, time)
+        ) PARTITION BY RANGE (time)
+        """,
+    )
+    op.execute("ALTER SEQUENCE orders_id_seq OWNED BY orders.id")
+
+    first, last = op.get_bind().execute(sa.text("SELECT min(time), max(time) FROM orders_unpartitioned")).one()
+    now = datetime.now()
+    month = (first or now).date().replace(day=1)
+    end = add_months(max(last or now, now).date().replace(day=1), MONTHS_AHEAD)
+    while month <= end:
+        op.execute(
+            f"CREATE TABLE orders_{month:%Y_%m} PARTITION OF orders "
+            f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')",
+        )
+        month = add_months(month, 1)
+    # Всё, что не попало в месячные секции (например, заказы старше первой из них), хранится здесь
+    op.execute("CREATE TABLE orders_default PARTITION OF orders DEFAULT")
+
+    op.execute(f"INSERT INTO orders ({COLUMNS}) SELECT {COLUMNS} FROM orders_unpartitioned")
+    op.execute("DROP TABLE orders_unpartitioned")
+    create_indexes()
+    op.execute("ANALYZE orders")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orders_author_id_id", table_name="orders")
+    op.drop_index("ix_orders_pending_time_id", table_name="orders")
+    op.execute("ALTER TABLE orders RENAME TO orders_partitioned")
+    op.execute("ALTER TABLE orders_partitioned RENAME CONSTRAINT orders_pkey TO orders_partitioned_pkey")
+
+    op.execute(
+        """
+        CREATE TABLE orders (
+            id INTEGER NOT NULL DEFAULT nextval('orders_id_seq'::regclass),
+            author_id VARCHAR(20) NOT NULL REFERENCES users (id),
+            address VARCHAR(255) NOT NULL,
+            time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            status orderstatus NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT orders_pkey PRIMARY KEY (id)
+        )
+        """,
+    )
+    op.execute("ALTER SEQUENCE orders_id_seq OWNED BY orders.id")
+    op.execute(f"INSERT INTO orders ({COLUMNS}) SELECT {COLUMNS} FROM orders_partitioned")
+    op.execute("DROP TABLE orders_partitioned")
+    create_indexes()
@@ -0,0 +1,58 @@
+"""create_orders_archive_table
+
+Revision ID: 9e4f1c3b7a20
+Revises: 7b3d9e2a4c61
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4f1c3b7a20"
+down_revision: Union[str, None] = "7b3d9e2a4c61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "orders_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("author_id", sa.String(length=20), nullable=False),
+        sa.Column("address", sa.String(length=255), nullable=False),
+        sa.Column("time", sa.DateTime(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "pending",
+                "accepted",
+                "completed",
+                "rejected",
+                "canceled",
+                name="orderstatus",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["author_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_orders_archive_author_id", "orders_archive", ["author_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orders_archive_author_id", table_name="orders_archive")
+    op.drop_table("orders_archive")
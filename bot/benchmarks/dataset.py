@@ -0,0 +1,87 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from database import DefaultDatabase, PoolStats
+
+
+SEED_USERS_SQL = text(
+    """
+    INSERT INTO users (id, username, phone_number, is_staff, is_superuser, date_joined)
+    SELECT 'seed_' || g, 'seed_user_' || g, '+7900' || lpad(g::text, 7, '0'), false, false, now()
+    FROM generate_series(1, :users) AS g
+    """,
+)
+
+# ~5% pending, ~5% accepted, the rest are finished orders spread over two years
+SEED_ORDERS_SQL = text(
+    """
+    INSERT INTO orders (author_id, address, time, status, created_at)
+    SELECT
+        'seed_' || (1 + g % :users),
+        'г. Москва, ул. Тестовая, д. ' || g,
+        date_trunc('hour', now()) + ((g % 730) - 550) * interval '1 day',
+        (CASE
+            WHEN g % 20 = 0 THEN 'pending'
+            WHEN g % 20 = 1 THEN 'accepted'
+            WHEN g % 20 < 12 THEN 'completed'
+            WHEN g % 20 < 16 THEN 'rejected'
+            ELSE 'canceled'
+        END)::orderstatus,
+        now()
+    FROM generate_series(1, :orders) AS g
+    """,
+)
+
+
+class BoundDatabase(DefaultDatabase):
+    """Database bound to a single connection and its outer transaction.
+
+    Repository commits only release a savepoint, so everything done through
+    it disappears once the outer transaction is rolled back.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        self.connection = connection
+
+    async def init_db(self):
+        """Tables are expected to exist already."""
+
+    async def drop_db(self):
+        """Tables are never dropped from a bound connection."""
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        """Context manager for sessions."""
+        current = self.current_session()
+        if current is not None:
+            async with self.savepoint(current) as session:
+                yield session
+            return
+
+        async with AsyncSession(
+            bind=self.connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+
+    async def close(self):
+        """The connection is owned by the caller."""
+
+    def pool_stats(self) -> PoolStats:
+        """A single connection, always checked out."""
+        return PoolStats(size=1, checked_out=1, idle=0, overflow=0, checkouts=0, wait_time=0.0, max_wait_time=0.0)
+
+
+async def seed(connection: AsyncConnection, users: int, orders: int) -> None:
+    """Fill the tables with a synthetic dataset and refresh planner statistics."""
+    await connection.execute(SEED_USERS_SQL, {"users": users})
+    await connection.execute(SEED_ORDERS_SQL, {"users": users, "orders": orders})
+    await connection.execute(text("ANALYZE users"))
+    await connection.execute(text("ANALYZE orders"))
+
+
+__all__ = ["BoundDatabase", "seed"]
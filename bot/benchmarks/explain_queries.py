@@ -0,0 +1,96 @@
+"""Show the query plans of repository queries over a seeded dataset.
+
+Usage (from the ``bot`` directory):
+
+    python -m benchmarks.explain_queries --users 10000 --orders 200000
+
+All data is inserted inside a transaction that is rolled back at the end,
+so the script can be pointed at any database with the schema migrated.
+"""
+
+import argparse
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import event
+
+from benchmarks.dataset import BoundDatabase, seed
+from config import Config, load_config
+from database import PostgresDatabase
+from logger import get_logger
+from repository import OrderRepository, UserRepository
+
+
+def repository_queries(
+    order_repo: OrderRepository,
+    user_repo: UserRepository,
+    first_pending: Any,
+) -> Dict[str, Callable[[], Awaitable[Any]]]:
+    pending_cursor = (first_pending.time, first_pending.id)
+    return {
+        "OrderRepository.get_one": lambda: order_repo.get_one(first_pending.id),
+        "OrderRepository.get_page": lambda: order_repo.get_page(5),
+        "OrderRepository.get_page (cursor)": lambda: order_repo.get_page(5, cursor=first_pending.id),
+        "OrderRepository.get_pending_page": lambda: order_repo.get_pending_page(5),
+        "OrderRepository.get_pending_page (cursor)": lambda: order_repo.get_pending_page(5, cursor=pending_cursor),
+        "OrderRepository.get_pending": lambda: order_repo.get_pending(),
+        "OrderRepository.get_by_author": lambda: order_repo.get_by_author("seed_1"),
+        "UserRepository.get_one": lambda: user_repo.get_one("seed_1"),
+        "UserRepository.get_by_username": lambda: user_repo.get_by_username("seed_user_1"),
+    }
+
+
+async def explain_queries(users: int, orders: int) -> None:
+    config: Config = load_config()
+    logger = get_logger("main", config.logger)
+
+    db = PostgresDatabase(config=config.postgres)
+    try:
+        async with db.engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                logger.info("Seeding %d users and %d orders...", users, orders)
+                await seed(connection, users, orders)
+
+                captured: List[Tuple[str, Any]] = []
+
+                def capture(conn, cursor, statement, parameters, context, executemany):
+                    captured.append((statement, parameters))
+
+                bound = BoundDatabase(connection)
+                order_repo = OrderRepository(bound)
+                user_repo = UserRepository(bound)
+                pending, _ = await order_repo.get_pending_page(1)
+
+                event.listen(connection.sync_connection, "before_cursor_execute", capture)
+                for name, query in repository_queries(order_repo, user_repo, pending[0]).items():
+                    captured.clear()
+                    try:
+                        await query()
+                    except Exception as e:
+                        logger.warning("%s: %s", name, e)
+                    statements = [(s, p) for s, p in captured if s.lstrip().upper().startswith(("SELECT", "WITH"))]
+
+                    for statement, parameters in statements:
+                        result = await connection.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                        plan = "\n".join(row[0] for row in result)
+                        seq_scan = "Seq Scan" in plan
+                        log = logger.warning if seq_scan else logger.info
+                        log("%s%s\n%s\n", name, " [SEQ SCAN]" if seq_scan else "", plan)
+
+            finally:
+                await transaction.rollback()
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EXPLAIN ANALYZE repository queries over a seeded dataset")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--orders", type=int, default=200_000)
+    args = parser.parse_args()
+
+    asyncio.run(explain_queries(args.users, args.orders))
+
+
+__all__ = []
@@ -0,0 +1,113 @@
+"""Compare loading orders as ORM entities with the ``OrderDetails`` projection.
+
+Usage (from the ``bot`` directory):
+
+    python -m benchmarks.projection --users 1000 --orders 50000 --repeat 5
+
+Runs against an in-memory SQLite database, so only the row hydration cost
+on the Python side is measured; no database server is needed.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import create_engine, desc, insert, select
+from sqlalchemy.orm import joinedload, Session
+
+from config import Config, load_config
+from database import Base
+from logger import get_logger
+from models import Order, OrderDetails, OrderStatus, User
+from repository.order import details_query
+
+
+def fill(session: Session, users: int, orders: int) -> None:
+    now = datetime.now()
+    statuses = list(OrderStatus)
+    session.execute(
+        insert(User),
+        [{"id": f"seed_{i}", "username": f"seed_user_{i}", "phone_number": f"+7900{i:07}"} for i in range(users)],
+    )
+    session.execute(
+        insert(Order),
+        [
+            {
+                "author_id": f"seed_{i % users}",
+                "address": f"г. Москва, ул. Тестовая, д. {i}",
+                "time": now + timedelta(hours=i % 2000),
+                "status": statuses[i % len(statuses)],
+                "created_at": now,
+            }
+            for i in range(orders)
+        ],
+    )
+    session.commit()
+
+
+def load_entities(session: Session) -> List[Any]:
+    stmt = select(Order).options(joinedload(Order.author)).order_by(desc(Order.id))
+    return list(session.execute(stmt).scalars().all())
+
+
+def load_projection(session: Session) -> List[Any]:
+    return [OrderDetails(*row) for row in session.execute(details_query().order_by(desc(Order.id))).tuples()]
+
+
+def measure(engine: Any, load: Callable[[Session], List[Any]], repeat: int) -> Dict[str, float]:
+    """Best wall time over ``repeat`` runs and the peak traced memory of one run."""
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            load(session)
+            best = min(best, time.perf_counter() - start)
+
+    with Session(engine) as session:
+        tracemalloc.start()
+        try:
+            rows = load(session)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {"rows": len(rows), "seconds": best, "peak_mib": peak / 1024 / 1024}
+
+
+def projection_benchmark(users: int, orders: int, repeat: int) -> None:
+    config: Config = load_config()
+    logger = get_logger("main", config.logger)
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        logger.info("Seeding %d users and %d orders...", users, orders)
+        fill(session, users, orders)
+
+    for name, load in (("ORM entities + joinedload", load_entities), ("OrderDetails projection", load_projection)):
+        result = measure(engine, load, repeat)
+        logger.info(
+            "%-26s %d rows in %.3f s (%.1f µs/row), peak %.1f MiB",
+            name,
+            result["rows"],
+            result["seconds"],
+            result["seconds"] / max(result["rows"], 1) * 1e6,
+            result["peak_mib"],
+        )
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ORM entities against column projections")
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    projection_benchmark(args.users, args.orders, args.repeat)
+
+
+__all__ = []
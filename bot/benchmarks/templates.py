@@ -0,0 +1,105 @@
+"""Measure the cost of rendering an admin list page with ``utils.templates``.
+
+Usage (from the ``bot`` directory):
+
+    python -m benchmarks.templates --rows 5 50 --repeat 20000
+
+Compares the page builder with the previous inline ``text +=`` loop, which
+did not escape user input. Needs neither a database nor Telegram.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import timeit
+from typing import Callable, List, Sequence
+
+from config import Config, load_config
+from logger import get_logger
+from models import OrderDetails, OrderStatus
+from utils import templates
+
+
+def make_orders(rows: int) -> List[OrderDetails]:
+    now = datetime.now()
+    statuses = list(OrderStatus)
+    return [
+        OrderDetails(
+            id=i,
+            author_id=str(1_000_000 + i),
+            username=f"user_{i}" if i % 3 else None,
+            phone_number=f"+7900{i:07}" if i % 2 else None,
+            # Каждый десятый адрес требует экранирования
+            address=f"г. Москва, ул. Тестовая, д. {i}, кв. {i % 100}" + ("" if i % 10 else " <корп. 2>"),
+            time=now + timedelta(hours=i),
+            status=statuses[i % len(statuses)],
+            created_at=now,
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy_page(title: str, orders: Sequence[OrderDetails], start: int = 1) -> str:
+    """The loop that was inlined in ``show_orders_page``"""
+    status_emojis = {"pending": "⏳", "accepted": "✅", "completed": "🎉", "rejected": "❌", "canceled": "🚫"}
+    status_texts = {
+        "pending": "В ожидании",
+        "accepted": "Принят",
+        "completed": "Выполнен",
+        "rejected": "Отклонён",
+        "canceled": "Отменён",
+    }
+
+    text = f"{title}\n\n"
+    for i, order in enumerate(orders, start=start):
+        status_emoji = status_emojis.get(order.status.value, "❓")
+        date_str = order.time.strftime("%d.%m.%Y %H:%M")
+
+        author_info = f"ID: {order.author_id}"
+        if order.username:
+            author_info += f" (@{order.username})"
+        if order.phone_number:
+            author_info += f"\n📱 {order.phone_number}"
+
+        text += (
+            f"<b>{i}. Заказ #{order.id}</b> {status_emoji}\n"
+            f"👤 {author_info}\n"
+            f"📍 {order.address[:50]}{'...' if len(order.address) > 50 else ''}\n"
+            f"📅 {date_str}\n"
+            f"📊 Статус: {status_texts.get(order.status.value, 'Неизвестно')}\n\n"
+        )
+    return text
+
+
+def measure(render: Callable[[str, Sequence[OrderDetails]], str], orders: Sequence[OrderDetails], repeat: int) -> float:
+    """Best time of one render in seconds over five rounds of ``repeat`` renders."""
+    timer = timeit.Timer(lambda: render("📋 Новые заявки", orders))
+    return min(timer.repeat(repeat=5, number=repeat)) / repeat
+
+
+def templates_benchmark(rows: Sequence[int], repeat: int) -> None:
+    config: Config = load_config()
+    logger = get_logger("main", config.logger)
+
+    for count in rows:
+        orders = make_orders(count)
+        for name, render in (("inline +=", legacy_page), ("templates.orders_page", templates.orders_page)):
+            seconds = measure(render, orders, repeat)
+            logger.info(
+                "%-22s %3d rows: %.1f µs/page, %.2f µs/row",
+                name,
+                count,
+                seconds * 1e6,
+                seconds / max(count, 1) * 1e6,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rendering of the admin order list")
+    parser.add_argument("--rows", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--repeat", type=int, default=20_000)
+    args = parser.parse_args()
+
+    templates_benchmark(args.rows, args.repeat)
+
+
+__all__ = []
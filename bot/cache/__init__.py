@@ -0,0 +1,6 @@
+from cache.counters import OrderCounters, OrderCountersConfig
+from cache.lru import LRUCache
+from cache.user import UserCache, UserCacheConfig
+
+
+__all__ = ["LRUCache", "OrderCounters", "OrderCountersConfig", "UserCache", "UserCacheConfig"]
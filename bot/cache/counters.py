@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from logging import Logger
+from typing import Awaitable, Callable, Dict, Mapping, Optional
+
+from redis.asyncio.client import Redis
+from redis.exceptions import RedisError, WatchError
+
+from models import OrderStatus
+
+
+@dataclass
+class OrderCountersConfig:
+    reconcile_interval: int
+
+
+class OrderCounters:
+    """Number of orders per status, kept in a Redis hash.
+
+    Only the ``orders`` table is counted: archived orders leave the counters.
+    Repositories adjust the counters once a status change is committed; a periodic
+    reconciliation with the database corrects any drift. Until the first
+    reconciliation (or after Redis lost the hash) the counters are reported
+    as unavailable.
+    """
+
+    KEY = "cache:orders:status"
+    SYNCED = "synced"
+
+    def __init__(self, redis: Redis, logger: Logger):
+        self.redis = redis
+        self.log = logger
+
+    async def changed(self, old: Optional[OrderStatus], new: Optional[OrderStatus], amount: int = 1) -> None:
+        """Move ``amount`` orders from ``old`` (``None`` for new orders) to ``new`` (``None`` for removed ones)."""
+        if old == new:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                if old is not None:
+                    pipe.hincrby(self.KEY, old.value, -amount)
+                if new is not None:
+                    pipe.hincrby(self.KEY, new.value, amount)
+                await pipe.execute()
+
+        except Exception as e:
+            self.log.error("OrderCounters: %s" % e)
+
+    async def get(self) -> Optional[Dict[OrderStatus, int]]:
+        try:
+            raw = await self.redis.hgetall(self.KEY)
+
+        except Exception as e:
+            self.log.error("OrderCounters: %s" % e)
+            return None
+
+        data = {(k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()}
+        if not data.pop(self.SYNCED, None):
+            return None
+        return {status: max(data.get(status.value, 0), 0) for status in OrderStatus}
+
+    async def reconcile(self, count: Callable[[], Awaitable[Mapping[OrderStatus, int]]], attempts: int = 3) -> bool:
+        """Replace the counters with values counted in the database by ``count``.
+
+        The hash is watched while counting: if a counter changes meanwhile, the
+        replacement is discarded and the count is taken again, so concurrent
+        increments are never overwritten. Returns whether the counters were replaced.
+        """
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for _ in range(attempts):
+                    await pipe.watch(self.KEY)
+                    counts = await count()
+                    mapping = {status.value: counts.get(status, 0) for status in OrderStatus}
+                    mapping[self.SYNCED] = 1
+
+                    pipe.multi()
+                    pipe.delete(self.KEY)
+                    pipe.hset(self.KEY, mapping=mapping)
+                    try:
+                        await pipe.execute()
+                        return True
+                    except WatchError:
+                        continue
+
+        except RedisError as e:
+            self.log.error("OrderCounters: %s" % e)
+            return False
+
+        self.log.warning("OrderCounters: counters kept changing, reconciliation skipped")
+        return False
+
+
+__all__ = ["OrderCounters", "OrderCountersConfig"]
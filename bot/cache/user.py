@@ -0,0 +1,120 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from logging import Logger
+from typing import Optional
+
+from redis.asyncio.client import Redis
+
+from cache.lru import LRUCache
+from models import User
+
+
+@dataclass
+class UserCacheConfig:
+    ttl: int
+    local_size: int
+    local_ttl: int
+
+
+class UserCache:
+    """Two-level User cache: a process-local LRU in front of Redis.
+
+    Invalidations are broadcast over a Redis channel so that every replica
+    drops its local copy.
+    """
+
+    KEY_PREFIX = "cache:user:"
+    CHANNEL = "cache:user:invalidate"
+
+    def __init__(self, redis: Redis, config: UserCacheConfig, logger: Logger):
+        self.redis = redis
+        self.config = config
+        self.log = logger
+        self.local: LRUCache[str, User] = LRUCache(config.local_size, config.local_ttl)
+
+    def _key(self, id: str) -> str:
+        return f"{self.KEY_PREFIX}{id}"
+
+    @staticmethod
+    def dump(user: User) -> str:
+        return json.dumps(
+            {
+                "id": user.id,
+                "username": user.username,
+                "phone_number": user.phone_number,
+                "is_staff": user.is_staff,
+                "is_superuser": user.is_superuser,
+                "date_joined": user.date_joined.isoformat() if user.date_joined else None,
+            },
+        )
+
+    @staticmethod
+    def load(raw: str | bytes) -> User:
+        data = json.loads(raw)
+        if data["date_joined"]:
+            data["date_joined"] = datetime.fromisoformat(data["date_joined"])
+        return User(**data)
+
+    async def get(self, id: str) -> Optional[User]:
+        user = self.local.get(id)
+        if user is not None:
+            return user
+
+        try:
+            raw = await self.redis.get(self._key(id))
+            if raw is None:
+                return None
+            user = self.load(raw)
+            self.local.set(id, user)
+            return user
+
+        except Exception as e:
+            self.log.error("UserCache: %s" % e)
+
+        return None
+
+    async def set(self, user: User) -> None:
+        raw = self.dump(user)
+        # Keep a detached copy: the given instance may still belong to a session
+        self.local.set(user.id, self.load(raw))
+        try:
+            await self.redis.set(self._key(user.id), raw, ex=self.config.ttl)
+
+        except Exception as e:
+            self.log.error("UserCache: %s" % e)
+
+    async def invalidate(self, id: str) -> None:
+        self.local.pop(id)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.delete(self._key(id))
+                pipe.publish(self.CHANNEL, id)
+                await pipe.execute()
+
+        except Exception as e:
+            self.log.error("UserCache: %s" % e)
+
+    async def listen(self) -> None:
+        """Drop local copies of users invalidated by any replica."""
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        data = message["data"]
+                        self.local.pop(data.decode() if isinstance(data, bytes) else data)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Invalidations may have been missed while disconnected
+                self.log.error("UserCache: %s" % e)
+                self.local.clear()
+                await asyncio.sleep(1)
+
+
+__all__ = ["UserCache", "UserCacheConfig"]
@@ -1,4 +1,4 @@
-from config.config import Config, load_config
+from config.config import Config, load_config, OrderArchiveConfig
 
 
-__all__ = ["Config", "load_config"]
+__all__ = ["Config", "load_config", "OrderArchiveConfig"]
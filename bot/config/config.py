@@ -2,7 +2,9 @@ from dataclasses import dataclass
 
 from environs import Env
 
+from cache import OrderCountersConfig, UserCacheConfig
 from database import PostgresConfig
+from fsm import FSMCacheConfig
 from logger import LoggerConfig
 
 
@@ -17,6 +19,15 @@ class RedisConfig:
 class BotConfig:
     bot_token: str
     debug: bool
+    unit_of_work: bool
+
+
+@dataclass
+class OrderArchiveConfig:
+    after_days: int
+    batch_size: int = 500
+    pause: float = 1.0
+    interval: int = 3600
 
 
 @dataclass
@@ -25,6 +36,10 @@ class Config:
     logger: LoggerConfig
     redis: RedisConfig
     postgres: PostgresConfig
+    user_cache: UserCacheConfig
+    fsm_cache: FSMCacheConfig
+    order_counters: OrderCountersConfig
+    order_archive: OrderArchiveConfig
 
 
 def load_config(path: str | None = None) -> Config:
@@ -43,6 +58,7 @@ def load_config(path: str | None = None) -> Config:
         bot=BotConfig(
             bot_token=env("BOT_TOKEN", default="").replace("\\x3a", ":"),
             debug=env.bool("DEBUG", default=True),
+            unit_of_work=env.bool("UNIT_OF_WORK", default=False),
         ),
         logger=LoggerConfig(
             debug=env.bool("DEBUG", default=True),
@@ -59,8 +75,36 @@ def load_config(path: str | None = None) -> Config:
             db_name=env("POSTGRES_DB", default=""),
             host=env("POSTGRES_HOST", default="localhost"),
             port=env.int("POSTGRES_PORT", default=5432),
+            pool_size=env.int("POSTGRES_POOL_SIZE", default=5),
+            max_overflow=env.int("POSTGRES_MAX_OVERFLOW", default=10),
+            pool_timeout=env.float("POSTGRES_POOL_TIMEOUT", default=30),
+            pool_recycle=env.int("POSTGRES_POOL_RECYCLE", default=-1),
+            pool_pre_ping=env.bool("POSTGRES_POOL_PRE_PING", default=False),
+            statement_cache_size=env.int("POSTGRES_STATEMENT_CACHE_SIZE", default=100),
+            command_timeout=env.float("POSTGRES_COMMAND_TIMEOUT", default=None),
+            replica_urls=env.list("POSTGRES_REPLICA_URLS", default=[]),
+            replica_retry_interval=env.float("POSTGRES_REPLICA_RETRY_INTERVAL", default=30),
+        ),
+        user_cache=UserCacheConfig(
+            ttl=env.int("USER_CACHE_TTL", default=300),
+            local_size=env.int("USER_CACHE_LOCAL_SIZE", default=10000),
+            local_ttl=env.int("USER_CACHE_LOCAL_TTL", default=60),
+        ),
+        fsm_cache=FSMCacheConfig(
+            enabled=env.bool("FSM_CACHE_ENABLED", default=False),
+            size=env.int("FSM_CACHE_SIZE", default=10000),
+            ttl=env.int("FSM_CACHE_TTL", default=30),
+        ),
+        order_counters=OrderCountersConfig(
+            reconcile_interval=env.int("ORDER_COUNTERS_RECONCILE_INTERVAL", default=300),
+        ),
+        order_archive=OrderArchiveConfig(
+            after_days=env.int("ORDER_ARCHIVE_AFTER_DAYS", default=90),
+            batch_size=env.int("ORDER_ARCHIVE_BATCH_SIZE", default=500),
+            pause=env.float("ORDER_ARCHIVE_PAUSE", default=1.0),
+            interval=env.int("ORDER_ARCHIVE_INTERVAL", default=3600),
         ),
     )
 
 
-__all__ = ["Config", "load_config"]
+__all__ = ["Config", "load_config", "OrderArchiveConfig"]
@@ -1,5 +1,17 @@
-from database.db import Base, DefaultDatabase
+from database.db import Base, DefaultDatabase, PoolStats
+from database.partitions import add_months, PartitionManager
 from database.postgres import Database as PostgresDatabase, PostgresConfig
+from database.sqlite import Database as SQLiteDatabase, SQLiteConfig
 
 
-__all__ = ["Base", "DefaultDatabase", "PostgresDatabase", "PostgresConfig"]
+__all__ = [
+    "add_months",
+    "Base",
+    "DefaultDatabase",
+    "PartitionManager",
+    "PoolStats",
+    "PostgresDatabase",
+    "PostgresConfig",
+    "SQLiteDatabase",
+    "SQLiteConfig",
+]
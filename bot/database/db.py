@@ -1,16 +1,38 @@
 from abc import ABC, abstractmethod
-from contextlib import _AsyncGeneratorContextManager
-from typing import Any
+from contextlib import _AsyncGeneratorContextManager, asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 
 
 Base = declarative_base()
 
+_unit_of_work: ContextVar[Optional[AsyncSession]] = ContextVar("unit_of_work", default=None)
+
+
+@dataclass
+class PoolStats:
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    wait_time: float
+    max_wait_time: float
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.wait_time / self.checkouts if self.checkouts else 0.0
+
 
 class DefaultDatabase(ABC):
     """Abstract Database class"""
 
+    AFTER_COMMIT = "after_commit"
+
     @abstractmethod
     async def init_db(self):
         """Creating all tables in the database."""
@@ -21,11 +43,123 @@ class DefaultDatabase(ABC):
 
     @abstractmethod
     def get_session(self) -> _AsyncGeneratorContextManager[Any, None]:
-        """Context manager for sessions."""
+        """Context manager for sessions.
+
+        Implementations must return the unit of work session, wrapped in
+        ``savepoint``, when one is active.
+        """
+
+    def get_read_session(self) -> _AsyncGeneratorContextManager[Any, None]:
+        """Context manager for read-only sessions.
+
+        Implementations may serve them from a replica, so writes made outside
+        the current unit of work might not be visible yet.
+        """
+        return self.get_session()
 
     @abstractmethod
     async def close(self):
         """Close all database connections and cleanup."""
 
+    @abstractmethod
+    def pool_stats(self) -> PoolStats:
+        """Connection pool usage and checkout wait times (seconds)."""
+
+    def current_session(self) -> Optional[AsyncSession]:
+        """Session of the unit of work running in the current context, if any."""
+        return _unit_of_work.get()
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[AsyncSession]:
+        """Share one session between all repository calls inside the block.
+
+        The transaction is committed once on exit and rolled back if the block
+        raised. A repository call that fails only undoes its own savepoint.
+        """
+        current = self.current_session()
+        if current is not None:
+            yield current
+            return
+
+        async with self.get_session() as session:
+            session: AsyncSession
+            token = _unit_of_work.set(session)
+            try:
+                yield session
+            except BaseException:
+                session.info.pop(self.AFTER_COMMIT, None)
+                await session.rollback()
+                raise
+            else:
+                await self._commit_unit(session)
+            finally:
+                _unit_of_work.reset(token)
+
+    async def commit_unit(self) -> None:
+        """Commit the current unit of work early, e.g. before slow Telegram calls.
+
+        The connection goes back to the pool; later repository calls start a
+        new transaction that is committed when the unit ends.
+        """
+        session = self.current_session()
+        if session is not None:
+            await self._commit_unit(session)
+
+    async def _commit_unit(self, session: AsyncSession) -> None:
+        await session.commit()
+        callbacks: List[Callable[[], Awaitable[Any]]] = session.info.pop(self.AFTER_COMMIT, [])
+        for callback in callbacks:
+            await callback()
+
+    @asynccontextmanager
+    async def savepoint(self, session: AsyncSession) -> AsyncIterator[AsyncSession]:
+        """Run one repository call of the unit of work in its own SAVEPOINT.
+
+        If the call fails, its changes and the callbacks it queued with
+        ``on_commit`` are dropped; the rest of the unit is kept.
+        """
+        callbacks = session.info.setdefault(self.AFTER_COMMIT, [])
+        queued = len(callbacks)
+        nested = await session.begin_nested()
+        try:
+            yield session
+        except BaseException:
+            del callbacks[queued:]
+            # Still open unless the repository already rolled it back; a failed flush only deactivates it
+            if session.get_nested_transaction() is nested:
+                await nested.rollback()
+            raise
+        else:
+            if nested.is_active:
+                await nested.commit()
+
+    async def commit(self, session: AsyncSession) -> None:
+        """Commit, or only flush when the session belongs to a unit of work."""
+        if session is self.current_session():
+            await session.flush()
+        else:
+            await session.commit()
+
+    async def rollback(self, session: AsyncSession) -> None:
+        """Roll back, or inside a unit of work only the current repository call."""
+        if session is self.current_session():
+            nested = session.get_nested_transaction()
+            if nested is not None:
+                await nested.rollback()
+        else:
+            await session.rollback()
+
+    async def on_commit(self, session: AsyncSession, callback: Callable[[], Awaitable[Any]]) -> None:
+        """Run ``callback`` once the changes made through ``session`` are committed.
+
+        Inside a unit of work it is queued until the unit commits; outside of
+        one the session is already committed and it runs right away. Callbacks
+        must handle their own errors.
+        """
+        if session is self.current_session():
+            session.info.setdefault(self.AFTER_COMMIT, []).append(callback)
+        else:
+            await callback()
+
 
-__all__ = ["Base", "DefaultDatabase"]
+__all__ = ["Base", "DefaultDatabase", "PoolStats"]
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import date
+from logging import Logger
+import re
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from database.postgres import Database
+
+
+MONTHS_AHEAD = 12
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month ``months`` after the month of ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class PartitionManager:
+    """Monthly range partitions of a table partitioned by a timestamp column.
+
+    Partitions are named ``<table>_YYYY_MM`` and cover ``[YYYY-MM-01, next month)``.
+    Rows outside of them go to the ``<table>_default`` partition created by the
+    migration. Months are only created ahead of time, before the default
+    partition can hold rows for them, so creating one never has to move rows.
+    """
+
+    def __init__(self, database: Database, logger: Logger, table: str = "orders"):
+        self.db = database
+        self.log = logger
+        self.table = table
+        self.name_pattern = re.compile(rf"^{re.escape(table)}_(\d{{4}})_(\d{{2}})$")
+
+    def partition_name(self, month: date) -> str:
+        return f"{self.table}_{month:%Y_%m}"
+
+    async def _is_partitioned(self, conn: AsyncConnection) -> bool:
+        stmt = text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))")
+        return bool(await conn.scalar(stmt, {"table": self.table}))
+
+    async def _partitions(self, conn: AsyncConnection) -> List[str]:
+        stmt = text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)",
+        )
+        return list((await conn.execute(stmt, {"table": self.table})).scalars())
+
+    async def create_ahead(self, months: int = MONTHS_AHEAD) -> List[str]:
+        """Create the partitions from the current month up to ``months`` ahead.
+
+        Returns the names of the created partitions.
+        """
+        created: List[str] = []
+        async with self.db.engine.begin() as conn:
+            if not await self._is_partitioned(conn):
+                self.log.warning("PartitionManager: table %s is not partitioned", self.table)
+                return created
+
+            existing = set(await self._partitions(conn))
+            current = date.today().replace(day=1)
+            for offset in range(months + 1):
+                month = add_months(current, offset)
+                name = self.partition_name(month)
+                if name in existing:
+                    continue
+
+                await conn.execute(
+                    text(
+                        f'CREATE TABLE "{name}" PARTITION OF "{self.table}" '
+                        f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')",
+                    ),
+                )
+                created.append(name)
+
+        if created:
+            self.log.info("PartitionManager: created %s", ", ".join(created))
+        return created
+
+    async def detach_older_than(self, months: int) -> List[str]:
+        """Detach partitions that ended more than ``months`` months before the current one.
+
+        Detached partitions stay in the database as standalone tables.
+        Returns their names.
+        """
+        cutoff = add_months(date.today().replace(day=1), -months)
+        async with self.db.engine.connect() as conn:
+            if not await self._is_partitioned(conn):
+                self.log.warning("PartitionManager: table %s is not partitioned", self.table)
+                return []
+
+            old = []
+            for name in sorted(await self._partitions(conn)):
+                match = self.name_pattern.match(name)
+                if match and add_months(date(int(match[1]), int(match[2]), 1), 1) <= cutoff:
+                    old.append(name)
+            await conn.rollback()
+
+            # CONCURRENTLY only takes a weak lock on the parent but cannot run in a transaction
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for name in old:
+                await conn.execute(text(f'ALTER TABLE "{self.table}" DETACH PARTITION "{name}" CONCURRENTLY'))
+
+        if old:
+            self.log.info("PartitionManager: detached %s", ", ".join(old))
+        return old
+
+    async def maintain(self, interval: int = 24 * 60 * 60) -> None:
+        """Keep partitions created ahead, checking every ``interval`` seconds."""
+        while True:
+            try:
+                await self.create_ahead()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.log.error("PartitionManager: %s" % e)
+
+            await asyncio.sleep(interval)
+
+
+__all__ = ["add_months", "PartitionManager"]
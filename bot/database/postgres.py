@@ -1,10 +1,16 @@
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import itertools
+from logging import getLogger, Logger
+import time
+from typing import List, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from database import Base, DefaultDatabase
+from database import Base, DefaultDatabase, PoolStats
 
 
 @dataclass
@@ -14,21 +20,84 @@ class PostgresConfig:
     db_name: str
     host: str
     port: int
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    statement_cache_size: int = 100
+    command_timeout: Optional[float] = None
+    replica_urls: List[str] = field(default_factory=list)
+    replica_retry_interval: float = 30
 
     def get_database_url(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}"
 
+    def get_replica_urls(self) -> List[str]:
+        return [url.replace("postgresql://", "postgresql+asyncpg://", 1) for url in self.replica_urls]
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts take"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_time += elapsed
+            self.max_wait_time = max(self.max_wait_time, elapsed)
+
+
+class Replica:
+    """Read-only replica, skipped for a while after it fails to connect"""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.async_session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)  # type: ignore
+        self.down_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self.down_until
+
 
 class Database(DefaultDatabase):
     """Postgres Database class"""
 
-    def __init__(self, config: PostgresConfig):
+    def __init__(self, config: PostgresConfig, logger: Optional[Logger] = None):
         self.config = config
-        self.engine = create_async_engine(
-            config.get_database_url(),
+        self.log = logger or getLogger(__name__)
+        self.engine = self._create_engine(config.get_database_url())
+        self.async_session = sessionmaker(bind=self.engine, class_=AsyncSession, expire_on_commit=False)  # type: ignore
+        self.replicas = [Replica(self._create_engine(url)) for url in config.get_replica_urls()]
+        self._next_replica = itertools.cycle(self.replicas)
+
+    def _create_engine(self, url: str) -> AsyncEngine:
+        config = self.config
+        return create_async_engine(
+            url,
             echo=False,
+            poolclass=InstrumentedPool,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_recycle=config.pool_recycle,
+            pool_pre_ping=config.pool_pre_ping,
+            connect_args={
+                "statement_cache_size": config.statement_cache_size,
+                "prepared_statement_cache_size": config.statement_cache_size,
+                "command_timeout": config.command_timeout,
+            },
         )
-        self.async_session = sessionmaker(bind=self.engine, class_=AsyncSession, expire_on_commit=False)  # type: ignore
 
     async def init_db(self):
         """Creating all tables in the database."""
@@ -43,12 +112,67 @@ class Database(DefaultDatabase):
     @asynccontextmanager
     async def get_session(self):
         """Context manager for sessions."""
+        current = self.current_session()
+        if current is not None:
+            async with self.savepoint(current) as session:
+                yield session
+            return
+
         async with self.async_session() as session:  # type: ignore
             yield session
 
+    @asynccontextmanager
+    async def get_read_session(self):
+        """Context manager for read-only sessions.
+
+        Replicas are used round-robin; one that fails to connect is skipped for
+        ``replica_retry_interval`` seconds. Falls back to the primary when no
+        replica is available and inside a unit of work.
+        """
+        current = self.current_session()
+        if current is not None:
+            async with self.savepoint(current) as session:
+                yield session
+            return
+
+        for _ in range(len(self.replicas)):
+            replica = next(self._next_replica)
+            if not replica.available:
+                continue
+
+            async with replica.async_session() as session:  # type: ignore
+                session: AsyncSession
+                try:
+                    await session.connection()
+                except (DBAPIError, InterfaceError, OperationalError, OSError) as e:
+                    replica.down_until = time.monotonic() + self.config.replica_retry_interval
+                    self.log.warning("Replica %s is unavailable: %s", replica.engine.url.host, e)
+                    continue
+
+                yield session
+                return
+
+        async with self.get_session() as session:
+            yield session
+
     async def close(self):
         """Close all database connections and cleanup."""
         await self.engine.dispose()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def pool_stats(self) -> PoolStats:
+        """Connection pool usage and checkout wait times (seconds)."""
+        pool: InstrumentedPool = self.engine.pool  # type: ignore
+        return PoolStats(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            checkouts=pool.checkouts,
+            wait_time=pool.wait_time,
+            max_wait_time=pool.max_wait_time,
+        )
 
 
 __all__ = ["Database", "PostgresConfig"]
@@ -0,0 +1,102 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from database.db import Base, DefaultDatabase, PoolStats
+
+
+MEMORY = ":memory:"
+
+
+@dataclass
+class SQLiteConfig:
+    path: str = MEMORY
+
+    def get_database_url(self) -> str:
+        return f"sqlite+aiosqlite:///{self.path}"
+
+
+def enable_foreign_keys(dbapi_connection, connection_record):
+    # SQLite does not check foreign keys unless asked to, Postgres always does
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+    # The driver would only BEGIN before DML, so a leading SAVEPOINT would start (and its RELEASE
+    # commit) the whole transaction; transactions are begun explicitly by begin_transaction instead
+    dbapi_connection.isolation_level = None
+
+
+def begin_transaction(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+class Database(DefaultDatabase):
+    """SQLite Database class (aiosqlite), for benchmarks and tests.
+
+    An in-memory database lives in a single connection shared by all sessions,
+    so it disappears once the database is closed and only one transaction can
+    be open at a time; use a file for concurrent units of work.
+    """
+
+    def __init__(self, config: SQLiteConfig):
+        self.config = config
+        if config.path == MEMORY:
+            self.engine = create_async_engine(
+                config.get_database_url(),
+                echo=False,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+            )
+        else:
+            self.engine = create_async_engine(config.get_database_url(), echo=False)
+        event.listen(self.engine.sync_engine, "connect", enable_foreign_keys)
+        event.listen(self.engine.sync_engine, "begin", begin_transaction)
+        self.async_session = sessionmaker(bind=self.engine, class_=AsyncSession, expire_on_commit=False)  # type: ignore
+
+    async def init_db(self):
+        """Creating all tables in the database."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def drop_db(self):
+        """Deleting all tables from the database."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+
+    @asynccontextmanager
+    async def get_session(self):
+        """Context manager for sessions."""
+        current = self.current_session()
+        if current is not None:
+            async with self.savepoint(current) as session:
+                yield session
+            return
+
+        async with self.async_session() as session:  # type: ignore
+            yield session
+
+    async def close(self):
+        """Close all database connections and cleanup."""
+        await self.engine.dispose()
+
+    def pool_stats(self) -> PoolStats:
+        """Connection pool usage; checkout wait times are not recorded."""
+        pool = self.engine.pool
+        if isinstance(pool, QueuePool):
+            return PoolStats(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                checkouts=0,
+                wait_time=0.0,
+                max_wait_time=0.0,
+            )
+        return PoolStats(size=1, checked_out=0, idle=1, overflow=0, checkouts=0, wait_time=0.0, max_wait_time=0.0)
+
+
+__all__ = ["Database", "SQLiteConfig"]
@@ -1,4 +1,5 @@
+from filters.callback import CallbackRoutes
 from filters.has_permissions import IsAdminFilter, IsSuperAdminFilter
 
 
-__all__ = ["IsAdminFilter", "IsSuperAdminFilter"]
+__all__ = ["CallbackRoutes", "IsAdminFilter", "IsSuperAdminFilter"]
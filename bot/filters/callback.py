@@ -0,0 +1,49 @@
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+from aiogram import Router
+from aiogram.dispatcher.event.handler import CallableObject
+from aiogram.filters import BaseFilter
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery
+
+
+class CallbackRoutes(BaseFilter):
+    """Callback query handlers of a router, looked up by the type of the callback data.
+
+    The router gets a single handler, so an update costs one dict lookup per
+    router instead of a filter check per handler. ``callback_data`` is
+    unpacked beforehand by ``CallbackDataMiddleware``.
+    """
+
+    def __init__(self, router: Router):
+        self.routes: Dict[Type[CallbackData], CallableObject] = {}
+        router.callback_query.register(self.dispatch, self)
+
+    async def __call__(
+        self,
+        callback: CallbackQuery,
+        callback_data: Optional[CallbackData] = None,
+    ) -> Union[bool, Dict[str, Any]]:
+        route = self.routes.get(type(callback_data))
+        if route is None:
+            return False
+        return {"callback_route": route}
+
+    def route(self, *callback_types: Type[CallbackData]) -> Callable:
+        """Register the decorated function as the handler of ``callback_types``."""
+
+        def register(handler: Callable) -> Callable:
+            for callback_type in callback_types:
+                if callback_type in self.routes:
+                    raise ValueError(f"{callback_type.__name__} already has a handler")
+                self.routes[callback_type] = CallableObject(handler)
+            return handler
+
+        return register
+
+    @staticmethod
+    async def dispatch(callback: CallbackQuery, callback_route: CallableObject, **data: Any) -> Any:
+        return await callback_route.call(callback, **data)
+
+
+__all__ = ["CallbackRoutes"]
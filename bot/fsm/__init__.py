@@ -0,0 +1,6 @@
+from fsm.context import BufferedFSMContext
+from fsm.middleware import BufferedFSMMiddleware
+from fsm.storage import CachedRedisStorage, FSMCacheConfig
+
+
+__all__ = ["BufferedFSMContext", "BufferedFSMMiddleware", "CachedRedisStorage", "FSMCacheConfig"]
@@ -0,0 +1,113 @@
+from contextlib import nullcontext
+from copy import deepcopy
+from typing import Any, Dict, Optional
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+from aiogram.fsm.storage.redis import RedisStorage
+
+from fsm.storage import CachedRedisStorage
+
+
+class BufferedFSMContext(FSMContext):
+    """FSM context that keeps state and data in memory for one update.
+
+    The state comes from the value already read by aiogram's FSM middleware,
+    the data is read on first access. Changes are kept until ``flush``, which
+    writes them in a single MULTI/EXEC for ``RedisStorage``, so a handler
+    reads its own writes without extra round trips.
+    """
+
+    def __init__(self, storage: BaseStorage, key: StorageKey, state: Optional[str]) -> None:
+        super().__init__(storage=storage, key=key)
+        self._state = state
+        self._data: Optional[Dict[str, Any]] = None
+        self._state_changed = False
+        self._data_changed = False
+
+    async def _load_data(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = await self.storage.get_data(key=self.key)
+        return self._data
+
+    async def set_state(self, state: StateType = None) -> None:
+        self._state = state.state if isinstance(state, State) else state
+        self._state_changed = True
+
+    async def get_state(self) -> Optional[str]:
+        return self._state
+
+    async def set_data(self, data: Dict[str, Any]) -> None:
+        self._data = deepcopy(data)
+        self._data_changed = True
+
+    async def get_data(self) -> Dict[str, Any]:
+        # Like a storage read, the caller gets its own copy
+        return deepcopy(await self._load_data())
+
+    async def get_value(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
+        return deepcopy((await self._load_data()).get(key, default))
+
+    async def update_data(self, data: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Dict[str, Any]:
+        if data:
+            kwargs.update(data)
+        current = await self._load_data()
+        current.update(deepcopy(kwargs))
+        self._data_changed = True
+        return deepcopy(current)
+
+    async def clear(self) -> None:
+        self._state = None
+        self._data = {}
+        self._state_changed = self._data_changed = True
+
+    @property
+    def changed(self) -> bool:
+        return self._state_changed or self._data_changed
+
+    async def flush(self) -> None:
+        """Write the buffered changes to the storage."""
+        if not self.changed:
+            return
+
+        if isinstance(self.storage, RedisStorage):
+            await self._flush_redis(self.storage)
+        else:
+            if self._state_changed:
+                await self.storage.set_state(key=self.key, state=self._state)
+            if self._data_changed:
+                await self.storage.set_data(key=self.key, data=self._data or {})
+        self._state_changed = self._data_changed = False
+
+    async def _flush_redis(self, storage: RedisStorage) -> None:
+        cached = isinstance(storage, CachedRedisStorage)
+        writing = (
+            storage.writing(self.key, state=self._state_changed, data=self._data_changed)  # type: ignore
+            if cached
+            else nullcontext()
+        )
+        # Same commands as RedisStorage.set_state / set_data, in one transaction
+        async with writing, storage.redis.pipeline(transaction=True) as pipe:
+            if self._state_changed:
+                state_key = storage.key_builder.build(self.key, "state")
+                if self._state is None:
+                    pipe.delete(state_key)
+                else:
+                    pipe.set(state_key, self._state, ex=storage.state_ttl)
+            if self._data_changed:
+                data_key = storage.key_builder.build(self.key, "data")
+                if not self._data:
+                    pipe.delete(data_key)
+                else:
+                    pipe.set(data_key, storage.json_dumps(self._data), ex=storage.data_ttl)
+            await pipe.execute()
+
+        if cached:
+            if self._state_changed:
+                storage.remember_state(self.key, self._state)
+            if self._data_changed:
+                storage.remember_data(self.key, self._data or {})
+
+
+__all__ = ["BufferedFSMContext"]
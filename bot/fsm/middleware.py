@@ -0,0 +1,36 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.fsm.context import FSMContext
+from aiogram.types import TelegramObject
+
+from fsm.context import BufferedFSMContext
+
+
+class BufferedFSMMiddleware(BaseMiddleware):
+    """Give handlers a ``BufferedFSMContext`` and flush it once the update is handled.
+
+    Must run inside aiogram's FSM middleware (any inner update middleware
+    does), which provides ``state`` and ``raw_state``. Changes are written even
+    if the handler fails, as they would have been without buffering.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        context = data.get("state")
+        if not isinstance(context, FSMContext) or isinstance(context, BufferedFSMContext):
+            return await handler(event, data)
+
+        buffered = BufferedFSMContext(storage=context.storage, key=context.key, state=data.get("raw_state"))
+        data["state"] = buffered
+        try:
+            return await handler(event, data)
+        finally:
+            await buffered.flush()
+
+
+__all__ = ["BufferedFSMMiddleware"]
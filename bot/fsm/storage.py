@@ -0,0 +1,110 @@
+from contextlib import asynccontextmanager
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Dict, Mapping, Optional, Tuple, TypeVar
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import StateType, StorageKey
+from aiogram.fsm.storage.redis import RedisStorage
+
+from cache.lru import LRUCache
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class FSMCacheConfig:
+    enabled: bool
+    size: int
+    ttl: int
+
+
+class CachedRedisStorage(RedisStorage):
+    """RedisStorage with a short-lived process-local copy of recently used keys.
+
+    Reads are served from the local LRU while it holds the key. Writes go to
+    Redis first; the local copy is dropped before the write and refreshed once
+    it succeeds. A read that overlapped a write of the same key does not fill
+    the cache, so it cannot replace the newer value. Other replicas are not
+    notified, so this only works when all updates of a chat are handled by the
+    same process (sticky routing).
+    """
+
+    def __init__(self, *args: Any, local_size: int, local_ttl: float, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # The state is wrapped in a tuple: a cached None means "no state"
+        self.states: LRUCache[StorageKey, Tuple[Optional[str]]] = LRUCache(local_size, local_ttl)
+        self.data: LRUCache[StorageKey, Dict[str, Any]] = LRUCache(local_size, local_ttl)
+        # Number of reads in flight per key, and writes of the key completed meanwhile
+        self._readers: Dict[StorageKey, int] = {}
+        self._generations: Dict[StorageKey, int] = {}
+
+    async def _read(self, key: StorageKey, read: Awaitable[T]) -> Tuple[T, bool]:
+        """Await ``read``; also returns whether no write of ``key`` completed meanwhile"""
+        self._readers[key] = self._readers.get(key, 0) + 1
+        generation = self._generations.get(key, 0)
+        try:
+            value = await read
+            return value, self._generations.get(key, 0) == generation
+        finally:
+            readers = self._readers.pop(key) - 1
+            if readers:
+                self._readers[key] = readers
+            else:
+                self._generations.pop(key, None)
+
+    @asynccontextmanager
+    async def writing(self, key: StorageKey, state: bool = False, data: bool = False) -> AsyncIterator[None]:
+        """Wrap a write of the state and/or data of ``key`` to Redis"""
+        if state:
+            self.states.pop(key)
+        if data:
+            self.data.pop(key)
+        try:
+            yield
+        finally:
+            # Also on failure: Redis may have been written anyway
+            if key in self._readers:
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        cached = self.states.get(key)
+        if cached is not None:
+            return cached[0]
+
+        state, fresh = await self._read(key, super().get_state(key))
+        if fresh:
+            self.states.set(key, (state,))
+        return state
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        async with self.writing(key, state=True):
+            await super().set_state(key, state)
+        self.remember_state(key, state)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        cached = self.data.get(key)
+        if cached is not None:
+            return deepcopy(cached)
+
+        data, fresh = await self._read(key, super().get_data(key))
+        if fresh:
+            self.data.set(key, deepcopy(data))
+        return data
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        async with self.writing(key, data=True):
+            await super().set_data(key, data)
+        self.remember_data(key, data)
+
+    def remember_state(self, key: StorageKey, state: StateType) -> None:
+        """Store a state that has just been written to Redis"""
+        self.states.set(key, (state.state if isinstance(state, State) else state,))
+
+    def remember_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        """Store data that has just been written to Redis"""
+        self.data.set(key, deepcopy(dict(data)))
+
+
+__all__ = ["CachedRedisStorage", "FSMCacheConfig"]
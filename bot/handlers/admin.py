@@ -1,29 +1,53 @@
 import asyncio
-import csv
 from datetime import datetime
-import io
 from logging import Logger
-from typing import Optional
+from typing import Collection, List, Optional, Sequence, Tuple, Union
 
 from aiogram import Bot, F, Router
 from aiogram.dispatcher.event.bases import UNHANDLED
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import (
-    BufferedInputFile,
     CallbackQuery,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     Message,
 )
 
-from filters import IsAdminFilter
-from keyboards import ToMainMenuKeyboard
-from models import Order
-from service import OrderService, UserService
+from database import DefaultDatabase
+from filters import CallbackRoutes, IsAdminFilter
+from keyboards import (
+    ADMIN_PANEL_KEYBOARD,
+    AdminAcceptCallback,
+    AdminAllOrdersCallback,
+    AdminBackToListCallback,
+    AdminBulkCallback,
+    AdminChangeStatusCallback,
+    AdminCompleteCallback,
+    AdminDayCallback,
+    AdminExportCallback,
+    AdminNewOrdersCallback,
+    AdminOrderCallback,
+    AdminPageCallback,
+    AdminPanelCallback,
+    AdminRefreshCallback,
+    AdminRejectCallback,
+    AdminReopenCallback,
+    AdminSelectCallback,
+    AdminSetStatusCallback,
+    CLIENT_NOTIFICATION_KEYBOARD,
+    IgnoreCallback,
+    TO_MAIN_MENU_KEYBOARD,
+    ToMainCallback,
+)
+from models import OrderDetails, OrderStatus
+from service import OrderService
+from utils import edit_or_send, SpooledInputFile, templates
 
 router = Router()
 router.message.filter(IsAdminFilter())
+router.callback_query.filter(IsAdminFilter())
+callbacks = CallbackRoutes(router)
 
 
 class AdminStates(StatesGroup):
@@ -32,61 +56,55 @@ class AdminStates(StatesGroup):
 
 
 ORDERS_PER_PAGE = 5
+CURSOR_TIME_FORMAT = "%Y%m%d%H%M%S%f"
+NOTIFY_BATCH_SIZE = 20
 
 
 @router.message(F.text == "🔐 Панель администратора")
-async def show_admin_panel(message: Message, state: FSMContext):
+async def show_admin_panel(message: Message, state: FSMContext, order_service: OrderService):
     """Отображение главной панели администратора"""
     await state.clear()
 
-    text = "👨‍💼 <b>Панель администратора</b>"
-    await message.answer(text, reply_markup=ToMainMenuKeyboard()())
+    text = "👨‍💼 <b>Панель администратора</b>" + await get_counters_text(order_service)
+    await message.answer(text, reply_markup=TO_MAIN_MENU_KEYBOARD)
 
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [InlineKeyboardButton(text="📋 Новые заявки", callback_data="admin_new_orders")],
-            [InlineKeyboardButton(text="📝 Все заявки", callback_data="admin_all_orders")],
-            [InlineKeyboardButton(text="🏠 Главное меню", callback_data="to_main")],
-        ],
-    )
+    await message.answer("Выберите действие:", reply_markup=ADMIN_PANEL_KEYBOARD)
 
-    await message.answer("Выберите действие:", reply_markup=keyboard)
 
-
-@router.callback_query(F.data == "admin_panel")
-async def admin_panel_callback(callback: CallbackQuery, state: FSMContext):
+@callbacks.route(AdminPanelCallback)
+async def admin_panel_callback(callback: CallbackQuery, state: FSMContext, order_service: OrderService):
     """Возврат в панель администратора"""
     await state.clear()
 
-    text = "👨‍💼 <b>Панель администратора</b>"
-    await callback.message.answer(text, reply_markup=ToMainMenuKeyboard()())  # type: ignore
-
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [InlineKeyboardButton(text="📋 Новые заявки", callback_data="admin_new_orders")],
-            [InlineKeyboardButton(text="📝 Все заявки", callback_data="admin_all_orders")],
-            [InlineKeyboardButton(text="🏠 Главное меню", callback_data="to_main")],
-        ],
-    )
+    text = "👨‍💼 <b>Панель администратора</b>" + await get_counters_text(order_service)
+    await callback.message.answer(text, reply_markup=TO_MAIN_MENU_KEYBOARD)  # type: ignore
 
-    await callback.message.answer("Выберите действие:", reply_markup=keyboard)  # type: ignore
+    await callback.message.answer("Выберите действие:", reply_markup=ADMIN_PANEL_KEYBOARD)  # type: ignore
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_new_orders")
+async def get_counters_text(order_service: OrderService) -> str:
+    """Количество новых и принятых заявок (из счётчиков, без запросов к базе)"""
+    counts = await order_service.count_by_status()
+    if counts is None:
+        return ""
+    return f"\n\n⏳ {counts[OrderStatus.pending]} новых / ✅ {counts[OrderStatus.accepted]} принятых"
+
+
+@callbacks.route(AdminNewOrdersCallback)
 async def show_new_orders(callback: CallbackQuery, state: FSMContext, order_service: OrderService):
     """Показать новые заявки (статус pending)"""
     await state.set_state(AdminStates.viewing_orders)
-    await state.update_data(filter_status="pending", page=0)
+    await state.update_data(filter_status="pending", page=0, selected=[])
 
     await show_orders_page(callback, state, order_service, status_filter="pending")
 
 
-@router.callback_query(F.data == "admin_all_orders")
+@callbacks.route(AdminAllOrdersCallback)
 async def show_all_orders(callback: CallbackQuery, state: FSMContext, order_service: OrderService):
     """Показать все заявки"""
     await state.set_state(AdminStates.viewing_orders)
-    await state.update_data(filter_status=None, page=0)
+    await state.update_data(filter_status=None, page=0, selected=[])
 
     await show_orders_page(callback, state, order_service)
 
@@ -97,373 +115,583 @@ async def show_orders_page(
     order_service: OrderService,
     status_filter: Optional[str] = None,
     page: int = 0,
-    delete_message: bool = True,
+    cursor: Optional[str] = None,
+    backward: bool = False,
+    edit_message: bool = True,
 ):
-    if delete_message:
-        await callback.message.delete()  # type: ignore
     """Отображение страницы с заявками"""
+    key = decode_cursor(cursor, status_filter)
     if status_filter == "pending":
-        orders = await order_service.get_pending()
+        orders, has_more = await order_service.get_pending_page(ORDERS_PER_PAGE, key, backward)  # type: ignore
         title = "📋 Новые заявки"
     else:
-        orders = await order_service.get(with_author=True)
+        orders, has_more = await order_service.get_page(ORDERS_PER_PAGE, key, backward)  # type: ignore
         title = "📝 Все заявки"
 
+    if not orders and cursor is not None:
+        # Страница опустела (заявки изменились) — возвращаемся к началу списка
+        return await show_orders_page(callback, state, order_service, status_filter, edit_message=edit_message)
+
+    await state.update_data(page=page, cursor=cursor, backward=backward)
+
     if not orders:
         text = f"{title}\n\n❌ Заявки не найдены."
         keyboard = InlineKeyboardMarkup(
-            inline_keyboard=[[InlineKeyboardButton(text="◀️ Назад", callback_data="admin_panel")]],
+            inline_keyboard=[[InlineKeyboardButton(text="◀️ Назад", callback_data=AdminPanelCallback().pack())]],
         )
-        await callback.message.answer(text, reply_markup=keyboard)  # type: ignore
+        await show_message(callback, text, keyboard, edit_message)
         await callback.answer()
         return UNHANDLED
 
-    total_orders = len(orders)
-    total_pages = (total_orders + ORDERS_PER_PAGE - 1) // ORDERS_PER_PAGE
-    start_idx = page * ORDERS_PER_PAGE
-    end_idx = min(start_idx + ORDERS_PER_PAGE, total_orders)
-    page_orders = orders[start_idx:end_idx]
-
-    text = f"{title}\n\n"
-
-    for i, order in enumerate(page_orders, start=start_idx + 1):
-        status_emoji = get_status_emoji(order.status.value)
-        date_str = order.time.strftime("%d.%m.%Y %H:%M")
-
-        author_info = f"ID: {order.author_id}"
-        if hasattr(order, "author") and order.author:
-            if order.author.username:
-                author_info += f" (@{order.author.username})"
-            if order.author.phone_number:
-                author_info += f"\n📱 {order.author.phone_number}"
-
-        text += (
-            f"<b>{i}. Заказ #{order.id}</b> {status_emoji}\n"
-            f"👤 {author_info}\n"
-            f"📍 {order.address[:50]}{'...' if len(order.address) > 50 else ''}\n"
-            f"📅 {date_str}\n"
-            f"📊 Статус: {get_status_text(order.status.value)}\n\n"
-        )
+    text = templates.orders_page(title, orders, start=page * ORDERS_PER_PAGE + 1)
 
-    keyboard = []
+    if status_filter == "pending":
+        selected = (await state.get_data()).get("selected", [])
+        keyboard = create_bulk_buttons(orders, selected)
+    else:
+        keyboard = [
+            [InlineKeyboardButton(text=f"📋 Заказ #{order.id}", callback_data=AdminOrderCallback(id=order.id).pack())]
+            for order in orders
+        ]
 
-    for _, order in enumerate(page_orders, start=start_idx):
-        keyboard.append([InlineKeyboardButton(text=f"📋 Заказ #{order.id}", callback_data=f"admin_order_{order.id}")])
+    keyboard.append(create_page_navigation(orders, status_filter, page, has_more, backward))
 
-    nav_buttons = []
-    if page > 0:
-        nav_buttons.append(InlineKeyboardButton(text="◀️ Пред.", callback_data=f"admin_page_{page-1}"))
+    keyboard.append(
+        [
+            InlineKeyboardButton(
+                text="📤 Экспорт",
+                callback_data=AdminExportCallback(pending_only=status_filter == "pending").pack(),
+            ),
+            InlineKeyboardButton(text="🔄 Обновить", callback_data=AdminRefreshCallback().pack()),
+            InlineKeyboardButton(text="◀️ Назад", callback_data=AdminPanelCallback().pack()),
+        ],
+    )
+
+    markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+    await show_message(callback, text, markup, edit_message)
+    await callback.answer()
+    return UNHANDLED
 
-    nav_buttons.append(InlineKeyboardButton(text=f"{page + 1}/{total_pages}", callback_data="ignore"))
 
-    if page < total_pages - 1:
-        nav_buttons.append(InlineKeyboardButton(text="След. ▶️", callback_data=f"admin_page_{page+1}"))
+async def show_message(callback: CallbackQuery, text: str, markup: InlineKeyboardMarkup, edit_message: bool = True):
+    """Показать текст на месте сообщения с кнопкой или отправить новым сообщением"""
+    if edit_message:
+        await edit_or_send(callback.message, text, reply_markup=markup)
+    else:
+        await callback.message.answer(text, reply_markup=markup)  # type: ignore
 
-    if nav_buttons:
-        keyboard.append(nav_buttons)
 
+def create_bulk_buttons(orders: Sequence[OrderDetails], selected: Collection[int]) -> List[List[InlineKeyboardButton]]:
+    """Кнопки выбора заявок и массовых действий для списка новых заявок"""
+    keyboard = [
+        [
+            InlineKeyboardButton(text=f"📋 Заказ #{order.id}", callback_data=AdminOrderCallback(id=order.id).pack()),
+            InlineKeyboardButton(
+                text="☑️" if order.id in selected else "⬜",
+                callback_data=AdminSelectCallback(id=order.id).pack(),
+            ),
+        ]
+        for order in orders
+    ]
+
+    if selected:
+        keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text=f"✅ Принять ({len(selected)})",
+                    callback_data=AdminBulkCallback(status="accepted").pack(),
+                ),
+                InlineKeyboardButton(
+                    text=f"❌ Отклонить ({len(selected)})",
+                    callback_data=AdminBulkCallback(status="rejected").pack(),
+                ),
+            ],
+        )
+
+    days = sorted({order.time.date() for order in orders})
     keyboard.append(
         [
-            InlineKeyboardButton(text="📤 Экспорт", callback_data=f"admin_export_{status_filter or 'all'}_{page}"),
-            InlineKeyboardButton(text="🔄 Обновить", callback_data="admin_refresh"),
-            InlineKeyboardButton(text="◀️ Назад", callback_data="admin_panel"),
+            InlineKeyboardButton(
+                text=f"✅ Все на {day.strftime('%d.%m')}",
+                callback_data=AdminDayCallback.of(day).pack(),
+            )
+            for day in days
         ],
     )
 
-    markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    return keyboard
 
-    await callback.message.answer(text, reply_markup=markup)  # type: ignore
-    await callback.answer()
-    return UNHANDLED
 
+def create_page_navigation(
+    orders: List[OrderDetails],
+    status_filter: Optional[str],
+    page: int,
+    has_more: bool,
+    backward: bool,
+) -> List[InlineKeyboardButton]:
+    """Кнопки навигации по страницам списка заявок"""
+    # При движении назад `has_more` означает наличие предыдущих страниц
+    has_prev = has_more if backward else page > 0
+    has_next = True if backward else has_more
+
+    nav_buttons = []
+    if has_prev:
+        prev_cursor = encode_cursor(orders[0], status_filter)
+        nav_buttons.append(
+            InlineKeyboardButton(
+                text="◀️ Пред.",
+                callback_data=AdminPageCallback(page=max(page - 1, 0), backward=True, cursor=prev_cursor).pack(),
+            ),
+        )
+
+    nav_buttons.append(InlineKeyboardButton(text=f"Стр. {page + 1}", callback_data=IgnoreCallback().pack()))
+
+    if has_next:
+        next_cursor = encode_cursor(orders[-1], status_filter)
+        nav_buttons.append(
+            InlineKeyboardButton(
+                text="След. ▶️",
+                callback_data=AdminPageCallback(page=page + 1, backward=False, cursor=next_cursor).pack(),
+            ),
+        )
+
+    return nav_buttons
 
-@router.callback_query(F.data.startswith("admin_export_"))
-async def export_orders(callback: CallbackQuery, state: FSMContext, order_service: OrderService):
-    parts = str(callback.data).split("_")
-    page = int(parts[3])
-    status_filter = parts[2]
 
+def encode_cursor(order: OrderDetails, status_filter: Optional[str]) -> str:
+    """Ключ заявки для постраничной навигации (передаётся в callback data)"""
     if status_filter == "pending":
-        orders = await order_service.get_pending()
+        return f"{order.time.strftime(CURSOR_TIME_FORMAT)}.{order.id}"
+    return str(order.id)
+
+
+def decode_cursor(cursor: Optional[str], status_filter: Optional[str]) -> Optional[Union[int, Tuple[datetime, int]]]:
+    """Разбор ключа, полученного из callback data"""
+    if not cursor:
+        return None
+    if status_filter == "pending":
+        time_str, id_str = cursor.split(".")
+        return datetime.strptime(time_str, CURSOR_TIME_FORMAT), int(id_str)
+    return int(cursor)
+
+
+@callbacks.route(AdminExportCallback)
+async def export_orders(
+    callback: CallbackQuery,
+    state: FSMContext,
+    order_service: OrderService,
+    database: DefaultDatabase,
+    callback_data: AdminExportCallback,
+):
+    pending_only = callback_data.pending_only
+
+    if pending_only:
         filename = "pending_orders_"
     else:
-        orders = await order_service.get(with_author=True)
         filename = "all_orders_<"
     filename += datetime.now().strftime("%d-%m-%Y") + ">.csv"
 
-    buffer = io.StringIO()
-    writer = csv.writer(buffer)
+    file = await order_service.export_csv(pending_only=pending_only, include_archive=not pending_only)
+    if file is None:
+        await callback.answer("❌ Ошибка при экспорте")
+        return
 
-    writer.writerow(["ID", "User ID", "Username", "Phone", "Address", "Order Time", "Status", "Created At"])
+    # Не держим транзакцию открытой, пока файл отправляется и идёт пауза
+    await database.commit_unit()
+    with file:
+        await callback.message.answer_document(  # type: ignore
+            document=SpooledInputFile(file, filename=filename),
+            caption=f"Экспорт заказов ({'ожидают ответа' if pending_only else 'все'})",
+        )
+    await callback.answer("📤 Файл экспортирован")
 
-    for order in orders:
-        username = f"@{order.author.username}" if order.author and order.author.username else ""
-        phone = order.author.phone_number if order.author and order.author.phone_number else ""
+    await asyncio.sleep(5)
+    data = await state.get_data()
+    await show_orders_page(
+        callback,
+        state,
+        order_service,
+        data.get("filter_status"),
+        data.get("page", 0),
+        data.get("cursor"),
+        data.get("backward", False),
+        edit_message=False,
+    )
 
-        order_time = order.time.strftime("%Y-%m-%d %H:%M:%S")
-        created_at = order.created_at.strftime("%Y-%m-%d %H:%M:%S") if order.created_at else ""
 
-        writer.writerow(
-            [order.id, order.author_id, username, phone, order.address, order_time, order.status.value, created_at],
-        )
+@callbacks.route(AdminPageCallback)
+async def handle_page_navigation(
+    callback: CallbackQuery,
+    state: FSMContext,
+    order_service: OrderService,
+    callback_data: AdminPageCallback,
+):
+    """Обработка навигации по страницам"""
+    data = await state.get_data()
+
+    await show_orders_page(
+        callback,
+        state,
+        order_service,
+        data.get("filter_status"),
+        callback_data.page,
+        callback_data.cursor,
+        backward=callback_data.backward,
+    )
 
-    csv_data = buffer.getvalue().encode("utf-8")
-    file = BufferedInputFile(csv_data, filename=filename)
 
-    await callback.message.answer_document(  # type: ignore
-        document=file,
-        caption=f"Экспорт заказов ({'ожидают ответа' if status_filter == 'pending' else 'все'})",
+@callbacks.route(AdminSelectCallback)
+async def toggle_order_selection(
+    callback: CallbackQuery,
+    state: FSMContext,
+    order_service: OrderService,
+    callback_data: AdminSelectCallback,
+):
+    """Отметить заявку для массового действия или снять отметку"""
+    order_id = callback_data.id
+    data = await state.get_data()
+
+    selected = data.get("selected", [])
+    if order_id in selected:
+        selected.remove(order_id)
+    else:
+        selected.append(order_id)
+    await state.update_data(selected=selected)
+
+    await show_orders_page(
+        callback,
+        state,
+        order_service,
+        data.get("filter_status"),
+        data.get("page", 0),
+        data.get("cursor"),
+        data.get("backward", False),
     )
-    await callback.answer("📤 Файл экспортирован")
 
-    await asyncio.sleep(5)
-    await show_orders_page(callback, state, order_service, status_filter, page, False)
 
+@callbacks.route(AdminBulkCallback)
+async def bulk_update_selected(
+    callback: CallbackQuery,
+    state: FSMContext,
+    order_service: OrderService,
+    bot: Bot,
+    logger: Logger,
+    database: DefaultDatabase,
+    callback_data: AdminBulkCallback,
+):
+    """Принять или отклонить все отмеченные заявки"""
+    status = callback_data.status
+    data = await state.get_data()
+
+    orders = await order_service.bulk_update_status(data.get("selected", []), status)
+    await finish_bulk_update(callback, state, order_service, bot, logger, database, orders, status)
+
+
+@callbacks.route(AdminDayCallback)
+async def accept_day_orders(
+    callback: CallbackQuery,
+    state: FSMContext,
+    order_service: OrderService,
+    bot: Bot,
+    logger: Logger,
+    database: DefaultDatabase,
+    callback_data: AdminDayCallback,
+):
+    """Принять все новые заявки на выбранную дату"""
+    day = callback_data.as_date
+
+    orders = await order_service.bulk_update_status_on(day, "accepted")
+    await finish_bulk_update(callback, state, order_service, bot, logger, database, orders, "accepted")
+
+
+async def finish_bulk_update(
+    callback: CallbackQuery,
+    state: FSMContext,
+    order_service: OrderService,
+    bot: Bot,
+    logger: Logger,
+    database: DefaultDatabase,
+    orders: List[OrderDetails],
+    status: str,
+):
+    """Обновление списка и уведомление клиентов после массового действия"""
+    # Изменения сохраняются до ответа администратору и рассылки клиентам
+    await database.commit_unit()
+    await state.update_data(selected=[])
+
+    if not orders:
+        text = "❌ Подходящие заявки не найдены"
+    elif status == "accepted":
+        text = f"✅ Принято заявок: {len(orders)}"
+    else:
+        text = f"❌ Отклонено заявок: {len(orders)}"
+    await callback.message.answer(text)  # type: ignore
 
-@router.callback_query(F.data.startswith("admin_page_"))
-async def handle_page_navigation(callback: CallbackQuery, state: FSMContext, order_service: OrderService):
-    """Обработка навигации по страницам"""
-    page = int(str(callback.data).split("_")[2])
     data = await state.get_data()
+    await show_orders_page(
+        callback,
+        state,
+        order_service,
+        data.get("filter_status"),
+        data.get("page", 0),
+        data.get("cursor"),
+        data.get("backward", False),
+    )
 
-    await state.update_data(page=page)
-    await show_orders_page(callback, state, order_service, data.get("filter_status"), page)
+    await notify_clients(bot, logger, orders, status)
 
 
-@router.callback_query(F.data == "admin_refresh")
+@callbacks.route(AdminRefreshCallback)
 async def refresh_orders(callback: CallbackQuery, state: FSMContext, order_service: OrderService):
     """Обновление списка заявок"""
     data = await state.get_data()
     page = data.get("page", 0)
     status_filter = data.get("filter_status")
 
-    await show_orders_page(callback, state, order_service, status_filter, page)
+    await show_orders_page(
+        callback,
+        state,
+        order_service,
+        status_filter,
+        page,
+        data.get("cursor"),
+        data.get("backward", False),
+    )
 
 
-@router.callback_query(F.data.startswith("admin_order_"))
+@callbacks.route(AdminOrderCallback)
 async def show_order_details(
     callback: CallbackQuery,
     state: FSMContext,
     order_service: OrderService,
-    user_service: UserService,
-    order_id: int = -1,
-    delete_message: bool = False,
+    callback_data: AdminOrderCallback,
+    edit_message: bool = True,
 ):
     """Показать детали заявки"""
-    if delete_message:
-        await callback.message.delete()  # type: ignore
-    if order_id == -1:
-        order_id = int(str(callback.data).split("_")[2])
-
-    order = await order_service.get_one(order_id)
+    order = await order_service.get_details(callback_data.id)
     if not order:
         await callback.answer("Заявка не найдена")
         return
 
-    author = await user_service.get_one(order.author_id)
+    await send_order_details(callback, state, order, edit_message)
+    await callback.answer()
 
+
+async def send_order_details(
+    callback: CallbackQuery,
+    state: FSMContext,
+    order: OrderDetails,
+    edit_message: bool = True,
+):
+    """Отправка карточки заявки с доступными действиями"""
     await state.set_state(AdminStates.order_details)
-    await state.update_data(order_id=order_id)
-
-    status_emoji = get_status_emoji(order.status.value)
-    date_str = order.time.strftime("%d.%m.%Y %H:%M")
-    created_str = order.created_at.strftime("%d.%m.%Y %H:%M")
-
-    author_info = f"ID: {order.author_id}"
-    if author:
-        if author.username:
-            author_info += f" (@{author.username})"
-        author_info += f"\n📱 {author.phone_number or 'Не указан'}"
-
-    text = (
-        f"📋 <b>Заказ #{order.id}</b> {status_emoji}\n\n"
-        f"👤 <b>Клиент:</b>\n{author_info}\n\n"
-        f"📍 <b>Адрес:</b>\n{order.address}\n\n"
-        f"📅 <b>Дата и время:</b> {date_str}\n"
-        f"📊 <b>Статус:</b> {get_status_text(order.status.value)}\n"
-        f"🕐 <b>Создан:</b> {created_str}\n\n"
-        "Выберите действие:"
-    )
+    await state.update_data(order_id=order.id)
+
+    text = templates.order_card(order)
 
     keyboard = []
 
     if order.status.value == "pending":
         keyboard.extend(
             [
-                [InlineKeyboardButton(text="✅ Принять", callback_data=f"admin_accept_{order_id}")],
-                [InlineKeyboardButton(text="❌ Отклонить", callback_data=f"admin_reject_{order_id}")],
+                [InlineKeyboardButton(text="✅ Принять", callback_data=AdminAcceptCallback(id=order.id).pack())],
+                [InlineKeyboardButton(text="❌ Отклонить", callback_data=AdminRejectCallback(id=order.id).pack())],
             ],
         )
     elif order.status.value == "accepted":
         keyboard.extend(
             [
-                [InlineKeyboardButton(text="✅ Выполнено", callback_data=f"admin_complete_{order_id}")],
-                [InlineKeyboardButton(text="❌ Отклонить", callback_data=f"admin_reject_{order_id}")],
+                [InlineKeyboardButton(text="✅ Выполнено", callback_data=AdminCompleteCallback(id=order.id).pack())],
+                [InlineKeyboardButton(text="❌ Отклонить", callback_data=AdminRejectCallback(id=order.id).pack())],
             ],
         )
     elif order.status.value in ["completed", "rejected"]:
-        keyboard.append([InlineKeyboardButton(text="🔄 Вернуть в работу", callback_data=f"admin_reopen_{order_id}")])
+        keyboard.append(
+            [InlineKeyboardButton(text="🔄 Вернуть в работу", callback_data=AdminReopenCallback(id=order.id).pack())],
+        )
 
     """
-    keyboard.append([InlineKeyboardButton(text="📝 Изменить статус", callback_data=f"admin_change_status_{order_id}")])
+    keyboard.append(
+        [InlineKeyboardButton(text="📝 Изменить статус", callback_data=AdminChangeStatusCallback(id=order.id).pack())],
+    )
     """
 
     keyboard.extend(
         [
-            [InlineKeyboardButton(text="◀️ К списку", callback_data="admin_back_to_list")],
-            [InlineKeyboardButton(text="🏠 Главное меню", callback_data="to_main")],
+            [InlineKeyboardButton(text="◀️ К списку", callback_data=AdminBackToListCallback().pack())],
+            [InlineKeyboardButton(text="🏠 Главное меню", callback_data=ToMainCallback().pack())],
         ],
     )
 
     markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
 
-    await callback.message.answer(text, reply_markup=markup)  # type: ignore
-    await callback.answer()
+    await show_message(callback, text, markup, edit_message)
 
 
-@router.callback_query(F.data.startswith("admin_accept_"))
+@callbacks.route(AdminAcceptCallback)
 async def accept_order(
     callback: CallbackQuery,
     order_service: OrderService,
-    user_service: UserService,
     bot: Bot,
     logger: Logger,
+    database: DefaultDatabase,
     state: FSMContext,
+    callback_data: AdminAcceptCallback,
 ):
     """Принять заявку"""
-    order_id = int(str(callback.data).split("_")[2])
+    order_id = callback_data.id
 
-    order = await order_service.update_status(order_id, "accepted")
+    order = await order_service.transition(order_id, "accepted")
 
     if order is not None:
-        await notify_client(bot, logger, order, user_service, "accepted")
+        # Изменение сохраняется до ответа администратору и уведомления клиента
+        await database.commit_unit()
+        await notify_client(bot, logger, order, "accepted")
 
         await callback.answer("✅ Заявка принята")
-        await show_order_details(callback, state, order_service, user_service, delete_message=True)
+        await send_order_details(callback, state, order)
     else:
         await callback.answer("❌ Ошибка при обновлении статуса")
 
 
-@router.callback_query(F.data.startswith("admin_reject_"))
+@callbacks.route(AdminRejectCallback)
 async def reject_order(
     callback: CallbackQuery,
     order_service: OrderService,
-    user_service: UserService,
     bot: Bot,
     logger: Logger,
+    database: DefaultDatabase,
     state: FSMContext,
+    callback_data: AdminRejectCallback,
 ):
     """Отклонить заявку"""
-    order_id = int(str(callback.data).split("_")[2])
+    order_id = callback_data.id
 
-    order = await order_service.update_status(order_id, "rejected")
+    order = await order_service.transition(order_id, "rejected")
 
     if order is not None:
-        await notify_client(bot, logger, order, user_service, "rejected")
+        # Изменение сохраняется до ответа администратору и уведомления клиента
+        await database.commit_unit()
+        await notify_client(bot, logger, order, "rejected")
 
         await callback.answer("❌ Заявка отклонена")
-        await show_order_details(callback, state, order_service, user_service, delete_message=True)
+        await send_order_details(callback, state, order)
     else:
         await callback.answer("❌ Ошибка при обновлении статуса")
 
 
-@router.callback_query(F.data.startswith("admin_complete_"))
+@callbacks.route(AdminCompleteCallback)
 async def complete_order(
     callback: CallbackQuery,
     order_service: OrderService,
-    user_service: UserService,
     bot: Bot,
     logger: Logger,
+    database: DefaultDatabase,
     state: FSMContext,
+    callback_data: AdminCompleteCallback,
 ):
     """Отметить заявку как выполненную"""
-    order_id = int(str(callback.data).split("_")[2])
+    order_id = callback_data.id
 
-    order = await order_service.update_status(order_id, "completed")
+    order = await order_service.transition(order_id, "completed")
 
     if order is not None:
-        await notify_client(bot, logger, order, user_service, "completed")
+        # Изменение сохраняется до ответа администратору и уведомления клиента
+        await database.commit_unit()
+        await notify_client(bot, logger, order, "completed")
 
         await callback.answer("✅ Заказ выполнен")
-        await show_order_details(callback, state, order_service, user_service, delete_message=True)
+        await send_order_details(callback, state, order)
     else:
         await callback.answer("❌ Ошибка при обновлении статуса")
 
 
-@router.callback_query(F.data.startswith("admin_reopen_"))
+@callbacks.route(AdminReopenCallback)
 async def reopen_order(
     callback: CallbackQuery,
     order_service: OrderService,
-    user_service: UserService,
     bot: Bot,
     logger: Logger,
+    database: DefaultDatabase,
     state: FSMContext,
+    callback_data: AdminReopenCallback,
 ):
     """Вернуть заявку в работу"""
-    order_id = int(str(callback.data).split("_")[2])
+    order_id = callback_data.id
 
-    order = await order_service.update_status(order_id, "pending")
+    order = await order_service.transition(order_id, "pending")
 
     if order is not None:
-        await notify_client(bot, logger, order, user_service, "reopen")
+        # Изменение сохраняется до ответа администратору и уведомления клиента
+        await database.commit_unit()
+        await notify_client(bot, logger, order, "reopen")
 
         await callback.answer("🔄 Заказ возвращен в работу")
-        await show_order_details(callback, state, order_service, user_service, delete_message=True)
+        await send_order_details(callback, state, order)
     else:
         await callback.answer("❌ Ошибка при обновлении статуса")
 
 
-@router.callback_query(F.data.startswith("admin_change_status_"))
-async def show_status_change_menu(callback: CallbackQuery, state: FSMContext):
+@callbacks.route(AdminChangeStatusCallback)
+async def show_status_change_menu(
+    callback: CallbackQuery,
+    state: FSMContext,
+    callback_data: AdminChangeStatusCallback,
+):
     """Показать меню изменения статуса"""
-    order_id = int(str(callback.data).split("_")[3])
+    order_id = callback_data.id
 
     text = "📝 <b>Изменение статуса заказа</b>\n\nВыберите новый статус:"
 
     keyboard = InlineKeyboardMarkup(
         inline_keyboard=[
-            [InlineKeyboardButton(text="⏳ В ожидании", callback_data=f"admin_set_status_{order_id}_pending")],
-            [InlineKeyboardButton(text="✅ Принята", callback_data=f"admin_set_status_{order_id}_accepted")],
-            [InlineKeyboardButton(text="🎉 Выполнена", callback_data=f"admin_set_status_{order_id}_completed")],
-            [InlineKeyboardButton(text="❌ Отклонена", callback_data=f"admin_set_status_{order_id}_rejected")],
-            [InlineKeyboardButton(text="◀️ Назад", callback_data=f"admin_order_{order_id}")],
-        ],
+            [InlineKeyboardButton(text=text, callback_data=AdminSetStatusCallback(id=order_id, status=status).pack())]
+            for text, status in (
+                ("⏳ В ожидании", "pending"),
+                ("✅ Принята", "accepted"),
+                ("🎉 Выполнена", "completed"),
+                ("❌ Отклонена", "rejected"),
+            )
+        ]
+        + [[InlineKeyboardButton(text="◀️ Назад", callback_data=AdminOrderCallback(id=order_id).pack())]],
     )
 
-    await callback.message.answer(text, reply_markup=keyboard)  # type: ignore
+    await edit_or_send(callback.message, text, reply_markup=keyboard)
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("admin_set_status_"))
+@callbacks.route(AdminSetStatusCallback)
 async def set_order_status(
     callback: CallbackQuery,
     order_service: OrderService,
-    user_service: UserService,
     bot: Bot,
     logger: Logger,
+    database: DefaultDatabase,
     state: FSMContext,
+    callback_data: AdminSetStatusCallback,
 ):
     """Установить новый статус заказа"""
-    parts = str(callback.data).split("_")
-    logger.debug(parts)
-    order_id = int(parts[3])
-    new_status = parts[4]
+    order_id = callback_data.id
+    new_status = callback_data.status
 
-    order = await order_service.update_status(order_id, new_status)
+    order = await order_service.transition(order_id, new_status, force=True)
 
     if order is not None:
+        # Изменение сохраняется до ответа администратору и уведомления клиента
+        await database.commit_unit()
         if new_status == "rejected":
-            await notify_client(bot, logger, order, user_service, "rejected")
+            await notify_client(bot, logger, order, "rejected")
 
-        status_text = get_status_text(new_status)
+        status_text = templates.status_text(new_status)
         await callback.answer(f"✅ Статус изменен на: {status_text}")
 
-        await show_order_details(callback, state, order_service, user_service, order_id=order_id)
+        await send_order_details(callback, state, order)
     else:
         await callback.answer("❌ Ошибка при обновлении статуса")
 
 
-@router.callback_query(F.data == "admin_back_to_list")
+@callbacks.route(AdminBackToListCallback)
 async def back_to_orders_list(callback: CallbackQuery, state: FSMContext, order_service: OrderService):
     """Возврат к списку заявок"""
     data = await state.get_data()
@@ -471,87 +699,40 @@ async def back_to_orders_list(callback: CallbackQuery, state: FSMContext, order_
     status_filter = data.get("filter_status")
 
     await state.set_state(AdminStates.viewing_orders)
-    await show_orders_page(callback, state, order_service, status_filter, page, delete_message=False)
+    await show_orders_page(
+        callback,
+        state,
+        order_service,
+        status_filter,
+        page,
+        data.get("cursor"),
+        data.get("backward", False),
+    )
 
 
-async def notify_client(bot: Bot, logger: Logger, order: Order, user_service: UserService, status: str):
+async def notify_client(bot: Bot, logger: Logger, order: OrderDetails, status: str):
     """Уведомление клиента об изменении статуса заказа"""
     try:
-
-        author = await user_service.get_one(order.author_id)
-        if not author:
+        text = templates.client_notification(order, status)
+        if text is None:
             return
 
-        date_str = order.time.strftime("%d.%m.%Y %H:%M")
-
-        if status == "accepted":
-            text = (
-                "✅ <b>Ваш заказ принят!</b>\n\n"
-                f"📋 <b>Заказ #{order.id}</b>\n"
-                f"📍 <b>Адрес:</b> {order.address}\n"
-                f"📅 <b>Дата и время:</b> {date_str}\n\n"
-                "Мы свяжемся с вами для уточнения деталей."
-            )
-        elif status == "completed":
-            text = (
-                "🎉 <b>Ваш заказ выполнен!</b>\n\n"
-                f"📋 <b>Заказ #{order.id}</b>\n"
-                f"📍 <b>Адрес:</b> {order.address}\n"
-                f"📅 <b>Дата и время:</b> {date_str}\n\n"
-                "Спасибо за использование наших услуг!"
-            )
-        elif status == "rejected":
-            text = (
-                "❌ <b>Ваш заказ отклонен</b>\n\n"
-                f"📋 <b>Заказ #{order.id}</b>\n"
-                f"📍 <b>Адрес:</b> {order.address}\n"
-                f"📅 <b>Дата и время:</b> {date_str}\n\n"
-                "К сожалению, мы не можем выполнить ваш заказ.\n"
-                "Вы можете оформить новый заказ с другими параметрами."
-            )
-        elif status == "reopen":
-            text = (
-                "🔄 <b>Ваш заказ возвращен в работу</b>\n\n"
-                f"📋 <b>Заказ #{order.id}</b>\n"
-                f"📍 <b>Адрес:</b> {order.address}\n"
-                f"📅 <b>Дата и время:</b> {date_str}\n\n"
-                "Мы свяжемся с вами для уточнения деталей."
-            )
-        else:
-            return
-
-        keyboard = InlineKeyboardMarkup(
-            inline_keyboard=[
-                [InlineKeyboardButton(text="🛒 Новый заказ", callback_data="start_order")],
-                [InlineKeyboardButton(text="🏠 Главное меню", callback_data="to_main")],
-            ],
-        )
-
-        await bot.send_message(chat_id=author.id, text=text, reply_markup=keyboard)
+        await bot.send_message(chat_id=order.author_id, text=text, reply_markup=CLIENT_NOTIFICATION_KEYBOARD)
 
     except Exception as e:
         logger.error(f"Ошибка при отправке уведомления: {e}")
 
 
-def get_status_emoji(status: str) -> str:
-    """Получить эмодзи для статуса"""
-    status_emojis = {"pending": "⏳", "accepted": "✅", "completed": "🎉", "rejected": "❌", "canceled": "🚫"}
-    return status_emojis.get(status, "❓")
-
-
-def get_status_text(status: str) -> str:
-    """Получить текстовое описание статуса"""
-    status_texts = {
-        "pending": "В ожидании",
-        "accepted": "Принят",
-        "completed": "Выполнен",
-        "rejected": "Отклонён",
-        "canceled": "Отменён",
-    }
-    return status_texts.get(status, "Неизвестно")
+async def notify_clients(bot: Bot, logger: Logger, orders: Sequence[OrderDetails], status: str):
+    """Пакетная рассылка уведомлений: не больше NOTIFY_BATCH_SIZE сообщений в секунду"""
+    for start in range(0, len(orders), NOTIFY_BATCH_SIZE):
+        if start:
+            await asyncio.sleep(1)
+        batch = orders[start:start + NOTIFY_BATCH_SIZE]
+        await asyncio.gather(*(notify_client(bot, logger, order, status) for order in batch))
 
 
-@router.callback_query(F.data == "ignore")
+@callbacks.route(IgnoreCallback)
 async def ignore_callback(callback: CallbackQuery):
     """Игнорирование нажатий на неактивные кнопки"""
     await callback.answer()
@@ -3,13 +3,15 @@ from aiogram.filters import Command, CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
-from keyboards import MainUserKeyboard, ToMainMenuKeyboard
+from filters import CallbackRoutes
+from keyboards import MAIN_USER_KEYBOARDS, TO_MAIN_MENU_KEYBOARD, ToMainCallback
 from models import User
 
 router = Router()
+callbacks = CallbackRoutes(router)
 
 
-@router.callback_query(F.data == "to_main")
+@callbacks.route(ToMainCallback)
 async def to_main_menu(callback: CallbackQuery, state: FSMContext, current_user: User):
     await state.clear()
     await process_start_command(callback.message, state, current_user=current_user)
@@ -28,7 +30,7 @@ async def process_start_command(message: Message, state: FSMContext, current_use
         "Нажмите кнопку ниже, чтобы оформить заказ:"
     )
 
-    keyboard = MainUserKeyboard()(is_admin=current_user.is_staff)
+    keyboard = MAIN_USER_KEYBOARDS[current_user.is_staff]
 
     await message.answer(welcome_text, reply_markup=keyboard)
 
@@ -48,7 +50,7 @@ async def process_help_command(message: Message) -> None:
         "4. Подтвердите заказ"
     )
 
-    keyboard = ToMainMenuKeyboard()()
+    keyboard = TO_MAIN_MENU_KEYBOARD
 
     await message.answer(help_text, reply_markup=keyboard)
 
@@ -69,7 +71,7 @@ async def help_callback(message: Message, current_user: User) -> None:
         "• Оплата производится после выполнения услуг"
     )
 
-    keyboard = MainUserKeyboard()(is_admin=current_user.is_staff)
+    keyboard = MAIN_USER_KEYBOARDS[current_user.is_staff]
 
     await message.answer(help_text, reply_markup=keyboard)
 
@@ -1,11 +1,94 @@
+from keyboards.admin import ADMIN_PANEL_KEYBOARD, CLIENT_NOTIFICATION_KEYBOARD
+from keyboards.calendar import build_calendar_keyboard, calendar_keyboards, CalendarKeyboards
+from keyboards.callbacks import (
+    AdminAcceptCallback,
+    AdminAllOrdersCallback,
+    AdminBackToListCallback,
+    AdminBulkCallback,
+    AdminChangeStatusCallback,
+    AdminCompleteCallback,
+    AdminDayCallback,
+    AdminExportCallback,
+    AdminNewOrdersCallback,
+    AdminOrderCallback,
+    AdminPageCallback,
+    AdminPanelCallback,
+    AdminRefreshCallback,
+    AdminRejectCallback,
+    AdminReopenCallback,
+    AdminSelectCallback,
+    AdminSetStatusCallback,
+    BackToAddressCallback,
+    BackToDateCallback,
+    BackToTimeCallback,
+    CalendarMonthCallback,
+    CALLBACKS,
+    CancelDraftCallback,
+    CancelOrderCallback,
+    ConfirmOrderCallback,
+    DateCallback,
+    IgnoreCallback,
+    parse_callback,
+    StartOrderCallback,
+    TimeCallback,
+    ToMainCallback,
+)
+from keyboards.frozen import FrozenInlineKeyboardMarkup, FrozenMarkupSession, FrozenReplyKeyboardMarkup
+from keyboards.order import CONFIRM_ORDER_KEYBOARD, TIME_KEYBOARD
 from keyboards.set_menu import setup_menu
-from keyboards.user import MainUserKeyboard, RequestPhoneNumberKeyboard, ToMainMenuKeyboard, ToMainOrOrderKeyboard
+from keyboards.user import (
+    MAIN_USER_KEYBOARDS,
+    REQUEST_PHONE_NUMBER_KEYBOARD,
+    TO_MAIN_MENU_KEYBOARD,
+    TO_MAIN_OR_ORDER_KEYBOARD,
+)
 
 
 __all__ = [
     "setup_menu",
-    "MainUserKeyboard",
-    "ToMainMenuKeyboard",
-    "ToMainOrOrderKeyboard",
-    "RequestPhoneNumberKeyboard",
+    "build_calendar_keyboard",
+    "calendar_keyboards",
+    "CalendarKeyboards",
+    "AdminAcceptCallback",
+    "AdminAllOrdersCallback",
+    "AdminBackToListCallback",
+    "AdminBulkCallback",
+    "AdminChangeStatusCallback",
+    "AdminCompleteCallback",
+    "AdminDayCallback",
+    "AdminExportCallback",
+    "AdminNewOrdersCallback",
+    "AdminOrderCallback",
+    "AdminPageCallback",
+    "AdminPanelCallback",
+    "AdminRefreshCallback",
+    "AdminRejectCallback",
+    "AdminReopenCallback",
+    "AdminSelectCallback",
+    "AdminSetStatusCallback",
+    "BackToAddressCallback",
+    "BackToDateCallback",
+    "BackToTimeCallback",
+    "CalendarMonthCallback",
+    "CALLBACKS",
+    "CancelDraftCallback",
+    "CancelOrderCallback",
+    "ConfirmOrderCallback",
+    "DateCallback",
+    "IgnoreCallback",
+    "parse_callback",
+    "StartOrderCallback",
+    "TimeCallback",
+    "ToMainCallback",
+    "FrozenInlineKeyboardMarkup",
+    "FrozenReplyKeyboardMarkup",
+    "FrozenMarkupSession",
+    "ADMIN_PANEL_KEYBOARD",
+    "CLIENT_NOTIFICATION_KEYBOARD",
+    "CONFIRM_ORDER_KEYBOARD",
+    "TIME_KEYBOARD",
+    "MAIN_USER_KEYBOARDS",
+    "TO_MAIN_MENU_KEYBOARD",
+    "TO_MAIN_OR_ORDER_KEYBOARD",
+    "REQUEST_PHONE_NUMBER_KEYBOARD",
 ]
@@ -1,18 +1,23 @@
-from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardButton
 
+from keyboards.callbacks import AdminAllOrdersCallback, AdminNewOrdersCallback, StartOrderCallback, ToMainCallback
+from keyboards.frozen import FrozenInlineKeyboardMarkup
 
-class AdminPanelKeyboard:
-    def __call__(self) -> InlineKeyboardMarkup:
-        return InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton(text="📋 Новые заявки", callback_data="admin_new_orders"),
-                    InlineKeyboardButton(text="📝 Все заявки", callback_data="admin_all_orders"),
-                ],
-                [InlineKeyboardButton(text="🏠 Главное меню", callback_data="to_main")],
-            ],
-            resize_keyboard=True,
-        )
 
+ADMIN_PANEL_KEYBOARD = FrozenInlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="📋 Новые заявки", callback_data=AdminNewOrdersCallback().pack())],
+        [InlineKeyboardButton(text="📝 Все заявки", callback_data=AdminAllOrdersCallback().pack())],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data=ToMainCallback().pack())],
+    ],
+)
 
-__all__ = ["AdminPanelKeyboard"]
+CLIENT_NOTIFICATION_KEYBOARD = FrozenInlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="🛒 Новый заказ", callback_data=StartOrderCallback().pack())],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data=ToMainCallback().pack())],
+    ],
+)
+
+
+__all__ = ["ADMIN_PANEL_KEYBOARD", "CLIENT_NOTIFICATION_KEYBOARD"]
@@ -0,0 +1,161 @@
+import asyncio
+import calendar
+from datetime import date, datetime, time, timedelta
+from logging import Logger
+from typing import Dict, List, Optional, Tuple
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from keyboards.callbacks import (
+    BackToAddressCallback,
+    CalendarMonthCallback,
+    CancelDraftCallback,
+    DateCallback,
+    IgnoreCallback,
+)
+from keyboards.frozen import FrozenInlineKeyboardMarkup
+from models import BOOKING_WINDOW
+
+
+MONTH_NAMES = {
+    1: "Январь",
+    2: "Февраль",
+    3: "Март",
+    4: "Апрель",
+    5: "Май",
+    6: "Июнь",
+    7: "Июль",
+    8: "Август",
+    9: "Сентябрь",
+    10: "Октябрь",
+    11: "Ноябрь",
+    12: "Декабрь",
+}
+WEEKDAYS = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"]
+IGNORE = IgnoreCallback().pack()
+
+
+def next_month(year: int, month: int) -> Tuple[int, int]:
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def prev_month(year: int, month: int) -> Tuple[int, int]:
+    return (year - 1, 12) if month == 1 else (year, month - 1)
+
+
+def month_callback(year: int, month: int) -> str:
+    return CalendarMonthCallback(year=year, month=month).pack()
+
+
+def booking_months(today: date) -> List[Tuple[int, int]]:
+    """Months reachable in the order calendar: the current one and those inside the booking window."""
+    current = date(today.year, today.month, 1)
+    max_date = current + BOOKING_WINDOW
+    months = [(current.year, current.month)]
+    while date(*months[-1], 1) < max_date:
+        months.append(next_month(*months[-1]))
+    return months
+
+
+def build_calendar_keyboard(year: int, month: int, today: date) -> InlineKeyboardMarkup:
+    """Создание клавиатуры-календаря для указанного месяца и года"""
+    keyboard = []
+
+    # Кнопки навигации по месяцам
+    nav_row = []
+
+    # Кнопка "предыдущий месяц" (показываем только если это не текущий месяц)
+    current_month_date = date(today.year, today.month, 1)
+    target_month_date = date(year, month, 1)
+
+    if target_month_date > current_month_date:
+        nav_row.append(InlineKeyboardButton(text="◀️", callback_data=month_callback(*prev_month(year, month))))
+    else:
+        nav_row.append(InlineKeyboardButton(text=" ", callback_data=IGNORE))
+
+    nav_row.append(InlineKeyboardButton(text=f"📅 {MONTH_NAMES[month]} {year}", callback_data=IGNORE))
+
+    # Кнопка "следующий месяц" (ограничиваем окном бронирования)
+    if target_month_date < current_month_date + BOOKING_WINDOW:
+        nav_row.append(InlineKeyboardButton(text="▶️", callback_data=month_callback(*next_month(year, month))))
+    else:
+        nav_row.append(InlineKeyboardButton(text=" ", callback_data=IGNORE))
+
+    keyboard.append(nav_row)
+
+    # Дни недели
+    keyboard.append([InlineKeyboardButton(text=day, callback_data=IGNORE) for day in WEEKDAYS])
+
+    last_day = today + BOOKING_WINDOW
+    for week in calendar.monthcalendar(year, month):
+        week_buttons = []
+        for day in week:
+            if day == 0:
+                week_buttons.append(InlineKeyboardButton(text=" ", callback_data=IGNORE))
+                continue
+
+            # Доступны только даты после сегодняшней и внутри окна бронирования
+            day_date = date(year, month, day)
+            if today < day_date <= last_day:
+                week_buttons.append(InlineKeyboardButton(text=str(day), callback_data=DateCallback.of(day_date).pack()))
+            else:
+                week_buttons.append(InlineKeyboardButton(text="❌", callback_data=IGNORE))
+        keyboard.append(week_buttons)
+
+    # Кнопки навигации и отмены
+    keyboard.append(
+        [
+            InlineKeyboardButton(text="◀️ Назад", callback_data=BackToAddressCallback().pack()),
+            InlineKeyboardButton(text="❌ Отменить", callback_data=CancelDraftCallback().pack()),
+        ],
+    )
+
+    return FrozenInlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
+class CalendarKeyboards:
+    """Prebuilt calendar markups for the months of the booking window.
+
+    A markup depends only on the month and today's date, so all of them are
+    rebuilt when the local date changes.
+    """
+
+    def __init__(self):
+        self.today: Optional[date] = None
+        self.markups: Dict[Tuple[int, int], InlineKeyboardMarkup] = {}
+
+    def warm(self, today: Optional[date] = None) -> None:
+        today = today or date.today()
+        self.markups = {
+            (year, month): build_calendar_keyboard(year, month, today) for year, month in booking_months(today)
+        }
+        self.today = today
+
+    def get(self, year: int, month: int) -> InlineKeyboardMarkup:
+        today = date.today()
+        if today != self.today:
+            self.warm(today)
+
+        markup = self.markups.get((year, month))
+        if markup is None:
+            return build_calendar_keyboard(year, month, today)
+        return markup
+
+    async def run(self, logger: Logger) -> None:
+        """Rebuild the markups right after every local midnight."""
+        while True:
+            now = datetime.now()
+            midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+            await asyncio.sleep((midnight - now).total_seconds())
+            try:
+                self.warm()
+                logger.debug("CalendarKeyboards: rebuilt %d months", len(self.markups))
+
+            except Exception as e:
+                logger.error("CalendarKeyboards: %s" % e)
+
+
+calendar_keyboards = CalendarKeyboards()
+
+
+__all__ = ["build_calendar_keyboard", "calendar_keyboards", "CalendarKeyboards", "next_month", "prev_month"]
@@ -0,0 +1,225 @@
+from datetime import date, datetime
+from typing import Dict, Optional, Type
+
+from aiogram.filters.callback_data import CallbackData
+
+# Payloads are packed as "<prefix>:<field>:..."; prefixes are kept to one or two
+# characters so that buttons stay far below Telegram's 64 byte limit.
+
+DAY_FORMAT = "%Y%m%d"
+SEPARATOR = ":"
+
+
+class ToMainCallback(CallbackData, prefix="m"):
+    pass
+
+
+class IgnoreCallback(CallbackData, prefix="i"):
+    pass
+
+
+# Order flow
+
+
+class StartOrderCallback(CallbackData, prefix="so"):
+    pass
+
+
+class BackToAddressCallback(CallbackData, prefix="ba"):
+    pass
+
+
+class BackToDateCallback(CallbackData, prefix="bd"):
+    pass
+
+
+class BackToTimeCallback(CallbackData, prefix="bt"):
+    pass
+
+
+class CalendarMonthCallback(CallbackData, prefix="cm"):
+    year: int
+    month: int
+
+
+class DateCallback(CallbackData, prefix="d"):
+    day: str
+
+    @classmethod
+    def of(cls, day: date) -> "DateCallback":
+        return cls(day=day.strftime(DAY_FORMAT))
+
+    @property
+    def as_date(self) -> date:
+        return datetime.strptime(self.day, DAY_FORMAT).date()
+
+
+class TimeCallback(CallbackData, prefix="t"):
+    hour: int
+
+    @property
+    def time(self) -> str:
+        return f"{self.hour:02}:00"
+
+
+class ConfirmOrderCallback(CallbackData, prefix="co"):
+    pass
+
+
+class CancelDraftCallback(CallbackData, prefix="cd"):
+    pass
+
+
+class CancelOrderCallback(CallbackData, prefix="cx"):
+    id: Optional[int] = None
+
+
+# Admin panel
+
+
+class AdminPanelCallback(CallbackData, prefix="ap"):
+    pass
+
+
+class AdminNewOrdersCallback(CallbackData, prefix="an"):
+    pass
+
+
+class AdminAllOrdersCallback(CallbackData, prefix="aa"):
+    pass
+
+
+class AdminRefreshCallback(CallbackData, prefix="ar"):
+    pass
+
+
+class AdminBackToListCallback(CallbackData, prefix="al"):
+    pass
+
+
+class AdminExportCallback(CallbackData, prefix="ae"):
+    pending_only: bool
+
+
+class AdminPageCallback(CallbackData, prefix="pg"):
+    page: int
+    backward: bool
+    cursor: str
+
+
+class AdminSelectCallback(CallbackData, prefix="sl"):
+    id: int
+
+
+class AdminBulkCallback(CallbackData, prefix="bk"):
+    status: str
+
+
+class AdminDayCallback(CallbackData, prefix="dy"):
+    day: str
+
+    @classmethod
+    def of(cls, day: date) -> "AdminDayCallback":
+        return cls(day=day.strftime(DAY_FORMAT))
+
+    @property
+    def as_date(self) -> date:
+        return datetime.strptime(self.day, DAY_FORMAT).date()
+
+
+class AdminOrderCallback(CallbackData, prefix="o"):
+    id: int
+
+
+class AdminAcceptCallback(CallbackData, prefix="ac"):
+    id: int
+
+
+class AdminRejectCallback(CallbackData, prefix="rj"):
+    id: int
+
+
+class AdminCompleteCallback(CallbackData, prefix="cp"):
+    id: int
+
+
+class AdminReopenCallback(CallbackData, prefix="ro"):
+    id: int
+
+
+class AdminChangeStatusCallback(CallbackData, prefix="cs"):
+    id: int
+
+
+class AdminSetStatusCallback(CallbackData, prefix="ss"):
+    id: int
+    status: str
+
+
+CALLBACKS: Dict[str, Type[CallbackData]] = {}
+for _callback in CallbackData.__subclasses__():
+    if _callback.__prefix__ in CALLBACKS:
+        raise ValueError(f"Callback prefix {_callback.__prefix__!r} is used twice")
+    CALLBACKS[_callback.__prefix__] = _callback
+
+
+def parse_legacy_callback(data: str) -> Optional[CallbackData]:
+    """Buttons of messages sent before the compact payloads that may still be pressed."""
+    if data == "to_main":
+        return ToMainCallback()
+    if data == "start_order":
+        return StartOrderCallback()
+    if data.startswith("cancel_this_order"):
+        order_id = data.removeprefix("cancel_this_order").lstrip("_")
+        return CancelOrderCallback(id=int(order_id) if order_id.isdigit() else None)
+    return None
+
+
+def parse_callback(data: Optional[str]) -> Optional[CallbackData]:
+    """Unpack callback data into the class registered for its prefix."""
+    if not data:
+        return None
+
+    callback = CALLBACKS.get(data.partition(SEPARATOR)[0])
+    if callback is None:
+        return parse_legacy_callback(data)
+
+    try:
+        return callback.unpack(data)
+    except (TypeError, ValueError):
+        return None
+
+
+__all__ = [
+    "AdminAcceptCallback",
+    "AdminAllOrdersCallback",
+    "AdminBackToListCallback",
+    "AdminBulkCallback",
+    "AdminChangeStatusCallback",
+    "AdminCompleteCallback",
+    "AdminDayCallback",
+    "AdminExportCallback",
+    "AdminNewOrdersCallback",
+    "AdminOrderCallback",
+    "AdminPageCallback",
+    "AdminPanelCallback",
+    "AdminRefreshCallback",
+    "AdminRejectCallback",
+    "AdminReopenCallback",
+    "AdminSelectCallback",
+    "AdminSetStatusCallback",
+    "BackToAddressCallback",
+    "BackToDateCallback",
+    "BackToTimeCallback",
+    "CalendarMonthCallback",
+    "CALLBACKS",
+    "CancelDraftCallback",
+    "CancelOrderCallback",
+    "ConfirmOrderCallback",
+    "DateCallback",
+    "IgnoreCallback",
+    "parse_callback",
+    "StartOrderCallback",
+    "TimeCallback",
+    "ToMainCallback",
+]
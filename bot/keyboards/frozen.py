@@ -0,0 +1,50 @@
+from typing import Any, Optional, Union
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods import TelegramMethod
+from aiogram.types import InlineKeyboardMarkup, ReplyKeyboardMarkup
+from aiohttp import FormData
+from pydantic import ConfigDict, PrivateAttr
+
+
+class FrozenInlineKeyboardMarkup(InlineKeyboardMarkup):
+    """Markup shared between messages; its rows must not be modified"""
+
+    model_config = ConfigDict(frozen=True)
+
+    _json: Optional[str] = PrivateAttr(default=None)
+
+
+class FrozenReplyKeyboardMarkup(ReplyKeyboardMarkup):
+    """Markup shared between messages; its rows must not be modified"""
+
+    model_config = ConfigDict(frozen=True)
+
+    _json: Optional[str] = PrivateAttr(default=None)
+
+
+FrozenMarkup = Union[FrozenInlineKeyboardMarkup, FrozenReplyKeyboardMarkup]
+
+
+class FrozenMarkupSession(AiohttpSession):
+    """Bot session that serializes every frozen markup only once.
+
+    aiogram dumps the whole method, ``reply_markup`` included, on each request;
+    a frozen markup cannot change, so its JSON is kept on the markup itself and
+    added to the form as is.
+    """
+
+    def build_form_data(self, bot: Bot, method: TelegramMethod[Any]) -> FormData:
+        markup = getattr(method, "reply_markup", None)
+        if not isinstance(markup, (FrozenInlineKeyboardMarkup, FrozenReplyKeyboardMarkup)):
+            return super().build_form_data(bot, method)
+
+        form = super().build_form_data(bot, method.model_copy(update={"reply_markup": None}))
+        if markup._json is None:
+            markup._json = self.prepare_value(markup, bot=bot, files={})
+        form.add_field("reply_markup", markup._json)
+        return form
+
+
+__all__ = ["FrozenInlineKeyboardMarkup", "FrozenMarkup", "FrozenMarkupSession", "FrozenReplyKeyboardMarkup"]
@@ -0,0 +1,51 @@
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from keyboards.callbacks import (
+    BackToDateCallback,
+    BackToTimeCallback,
+    CancelDraftCallback,
+    ConfirmOrderCallback,
+    TimeCallback,
+)
+from keyboards.frozen import FrozenInlineKeyboardMarkup
+
+
+TIME_SLOTS = [TimeCallback(hour=hour) for hour in range(9, 24)]
+
+
+def build_time_keyboard() -> InlineKeyboardMarkup:
+    """Создание клавиатуры для выбора времени"""
+    keyboard = []
+    row = []
+    for i, slot in enumerate(TIME_SLOTS):
+        row.append(InlineKeyboardButton(text=slot.time, callback_data=slot.pack()))
+        if (i + 1) % 3 == 0:  # По 3 кнопки в ряд
+            keyboard.append(row)
+            row = []
+
+    if row:  # Добавляем оставшиеся кнопки
+        keyboard.append(row)
+
+    # Кнопки навигации
+    keyboard.append(
+        [
+            InlineKeyboardButton(text="◀️ Назад", callback_data=BackToDateCallback().pack()),
+            InlineKeyboardButton(text="❌ Отменить", callback_data=CancelDraftCallback().pack()),
+        ],
+    )
+
+    return FrozenInlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
+TIME_KEYBOARD = build_time_keyboard()
+
+CONFIRM_ORDER_KEYBOARD = FrozenInlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="✅ Подтвердить заказ", callback_data=ConfirmOrderCallback().pack())],
+        [InlineKeyboardButton(text="◀️ Изменить время", callback_data=BackToTimeCallback().pack())],
+        [InlineKeyboardButton(text="❌ Отменить", callback_data=CancelDraftCallback().pack())],
+    ],
+)
+
+
+__all__ = ["build_time_keyboard", "CONFIRM_ORDER_KEYBOARD", "TIME_KEYBOARD", "TIME_SLOTS"]
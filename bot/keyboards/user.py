@@ -1,44 +1,48 @@
-from aiogram.types import KeyboardButton, ReplyKeyboardMarkup
-
-
-class MainUserKeyboard:
-    def __call__(self, is_admin: bool) -> ReplyKeyboardMarkup:
-        buttons: list[list[KeyboardButton]] = [
-            [KeyboardButton(text="🛒 Оформить заказ"), KeyboardButton(text="ℹ️ Помощь")],
-        ]
-        if is_admin:
-            buttons.append([KeyboardButton(text="🔐 Панель администратора")])
-        return ReplyKeyboardMarkup(keyboard=buttons, resize_keyboard=True)
-
-
-class ToMainMenuKeyboard:
-    def __call__(self) -> ReplyKeyboardMarkup:
-        return ReplyKeyboardMarkup(
-            keyboard=[[KeyboardButton(text="🏠 Главное меню")]],
-            resize_keyboard=True,
-        )
-
-
-class ToMainOrOrderKeyboard:
-    def __call__(self) -> ReplyKeyboardMarkup:
-        return ReplyKeyboardMarkup(
-            keyboard=[
-                [KeyboardButton(text="🏠 Главное меню")],
-                [KeyboardButton(text="🛒 Оформить заказ")],
-            ],
-            resize_keyboard=True,
-        )
-
-
-class RequestPhoneNumberKeyboard:
-    def __call__(self) -> ReplyKeyboardMarkup:
-        return ReplyKeyboardMarkup(
-            keyboard=[
-                [KeyboardButton(text="📱 Поделиться номером", request_contact=True)],
-            ],
-            resize_keyboard=True,
-            one_time_keyboard=True,
-        )
+from typing import Dict
 
+from aiogram.types import KeyboardButton, ReplyKeyboardMarkup
 
-__all__ = ["MainUserKeyboard", "ToMainMenuKeyboard", "ToMainOrOrderKeyboard", "RequestPhoneNumberKeyboard"]
+from keyboards.frozen import FrozenReplyKeyboardMarkup
+
+
+def build_main_user_keyboard(is_admin: bool) -> ReplyKeyboardMarkup:
+    buttons: list[list[KeyboardButton]] = [
+        [KeyboardButton(text="🛒 Оформить заказ"), KeyboardButton(text="ℹ️ Помощь")],
+    ]
+    if is_admin:
+        buttons.append([KeyboardButton(text="🔐 Панель администратора")])
+    return FrozenReplyKeyboardMarkup(keyboard=buttons, resize_keyboard=True)
+
+
+MAIN_USER_KEYBOARDS: Dict[bool, ReplyKeyboardMarkup] = {
+    is_admin: build_main_user_keyboard(is_admin) for is_admin in (False, True)
+}
+
+TO_MAIN_MENU_KEYBOARD = FrozenReplyKeyboardMarkup(
+    keyboard=[[KeyboardButton(text="🏠 Главное меню")]],
+    resize_keyboard=True,
+)
+
+TO_MAIN_OR_ORDER_KEYBOARD = FrozenReplyKeyboardMarkup(
+    keyboard=[
+        [KeyboardButton(text="🏠 Главное меню")],
+        [KeyboardButton(text="🛒 Оформить заказ")],
+    ],
+    resize_keyboard=True,
+)
+
+REQUEST_PHONE_NUMBER_KEYBOARD = FrozenReplyKeyboardMarkup(
+    keyboard=[
+        [KeyboardButton(text="📱 Поделиться номером", request_contact=True)],
+    ],
+    resize_keyboard=True,
+    one_time_keyboard=True,
+)
+
+
+__all__ = [
+    "MAIN_USER_KEYBOARDS",
+    "TO_MAIN_MENU_KEYBOARD",
+    "TO_MAIN_OR_ORDER_KEYBOARD",
+    "REQUEST_PHONE_NUMBER_KEYBOARD",
+]
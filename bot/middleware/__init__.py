@@ -1,15 +1,31 @@
 from logging import Logger
+from typing import Optional
 
 from aiogram import Dispatcher
 
+from database import DefaultDatabase
+from fsm import BufferedFSMMiddleware
+from middleware.callback import CallbackDataMiddleware
+from middleware.database import UnitOfWorkMiddleware
 from middleware.logging import LoggingMiddleware
 from middleware.user import CurrentUserMiddleware
 from service import UserService
 
 
-def setup(dispatcher: Dispatcher, logger: Logger, user_service: UserService):
+def setup(
+    dispatcher: Dispatcher,
+    logger: Logger,
+    user_service: UserService,
+    database: Optional[DefaultDatabase] = None,
+):
     dispatcher.update.middleware(CurrentUserMiddleware(user_service=user_service))
     dispatcher.update.middleware(LoggingMiddleware(logger))
+    # FSM changes are written in one transaction after the handler (and its unit of work) is done
+    dispatcher.update.middleware(BufferedFSMMiddleware())
+    dispatcher.callback_query.outer_middleware(CallbackDataMiddleware())
+    if database is not None:
+        # Innermost, so that handler errors roll the unit back before they are logged
+        dispatcher.update.middleware(UnitOfWorkMiddleware(database))
 
 
-__all__ = ["setup"]
+__all__ = ["CallbackDataMiddleware", "setup"]
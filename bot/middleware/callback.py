@@ -0,0 +1,22 @@
+from typing import Any, Awaitable, Callable, cast, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery, TelegramObject
+
+from keyboards import parse_callback
+
+
+class CallbackDataMiddleware(BaseMiddleware):
+    """Unpack the callback data of a callback query once for all routers."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        data["callback_data"] = parse_callback(cast(CallbackQuery, event).data)
+        return await handler(event, data)
+
+
+__all__ = ["CallbackDataMiddleware"]
@@ -0,0 +1,32 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from database import DefaultDatabase
+
+
+class UnitOfWorkMiddleware(BaseMiddleware):
+    """Runs the handler inside one database session and transaction.
+
+    Repositories pick the session up through ``DefaultDatabase.get_session``;
+    it is also available to handlers as ``session``. Handlers that wait on
+    Telegram for long should commit first with ``DefaultDatabase.commit_unit``.
+    """
+
+    def __init__(self, database: DefaultDatabase):
+        self.database = database
+        super().__init__()
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        update: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        async with self.database.unit_of_work() as session:
+            data["session"] = session
+            return await handler(update, data)
+
+
+__all__ = ["UnitOfWorkMiddleware"]
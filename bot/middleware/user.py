@@ -32,13 +32,10 @@ class CurrentUserMiddleware(BaseMiddleware):
 
         username = user.username or user.full_name or user.first_name or f"user_{user.id}"
 
-        current_user = await self.user_service.get_or_create(id=str(user.id), username=username)
+        current_user = await self.user_service.upsert_seen(id=str(user.id), username=username)
         if not current_user:
             return await handler(update, data)
 
-        if current_user.username != username:
-            current_user = await self.user_service.update_username(current_user.id, username)
-
         data["current_user"] = current_user
         return await handler(update, data)
 
@@ -1,5 +1,22 @@
-from models.order import Order, OrderStatus
+from models.order import (
+    BOOKING_WINDOW,
+    FINISHED_STATUSES,
+    Order,
+    ORDER_TRANSITIONS,
+    OrderArchive,
+    OrderDetails,
+    OrderStatus,
+)
 from models.user import User
 
 
-__all__ = ["User", "Order", "OrderStatus"]
+__all__ = [
+    "User",
+    "Order",
+    "OrderArchive",
+    "OrderDetails",
+    "OrderStatus",
+    "ORDER_TRANSITIONS",
+    "BOOKING_WINDOW",
+    "FINISHED_STATUSES",
+]
@@ -1,7 +1,9 @@
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import Enum as PyEnum
+from typing import Dict, FrozenSet, Optional
 
-from sqlalchemy import DateTime, Enum as SqlEnum, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Enum as SqlEnum, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
@@ -15,8 +17,30 @@ class OrderStatus(PyEnum):
     canceled = "canceled"
 
 
+# How far ahead an order can be booked
+BOOKING_WINDOW = timedelta(days=180)
+
+# Orders in these statuses are final and may be moved to the archive
+FINISHED_STATUSES: FrozenSet[OrderStatus] = frozenset(
+    {OrderStatus.completed, OrderStatus.rejected, OrderStatus.canceled},
+)
+
+# Statuses an order may move to, mapped to the statuses it may move from
+ORDER_TRANSITIONS: Dict[OrderStatus, FrozenSet[OrderStatus]] = {
+    OrderStatus.accepted: frozenset({OrderStatus.pending}),
+    OrderStatus.rejected: frozenset({OrderStatus.pending, OrderStatus.accepted}),
+    OrderStatus.completed: frozenset({OrderStatus.accepted}),
+    OrderStatus.pending: frozenset({OrderStatus.completed, OrderStatus.rejected}),
+    OrderStatus.canceled: frozenset({OrderStatus.pending, OrderStatus.accepted}),
+}
+
+
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_pending_time_id", "time", "id", postgresql_where=text("status = 'pending'")),
+        Index("ix_orders_author_id_id", "author_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     author_id: Mapped[str] = mapped_column(String(20), ForeignKey("users.id"))
@@ -31,4 +55,43 @@ class Order(Base):
         return f"<Order(id={self.id}, author_id={self.author_id}, status={self.status})>"
 
 
-__all__ = ["Order", "OrderStatus"]
+class OrderArchive(Base):
+    """Finished orders moved out of ``orders`` by the archiver"""
+
+    __tablename__ = "orders_archive"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    author_id: Mapped[str] = mapped_column(String(20), ForeignKey("users.id"), index=True)
+    address: Mapped[str] = mapped_column(String(255), nullable=False)
+    time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    status: Mapped[OrderStatus] = mapped_column(SqlEnum(OrderStatus), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+
+    def __repr__(self):
+        return f"<OrderArchive(id={self.id}, author_id={self.author_id}, status={self.status})>"
+
+
+@dataclass(slots=True, frozen=True)
+class OrderDetails:
+    """Order row joined with its author's contact fields"""
+
+    id: int
+    author_id: str
+    username: Optional[str]
+    phone_number: Optional[str]
+    address: str
+    time: datetime
+    status: OrderStatus
+    created_at: Optional[datetime]
+
+
+__all__ = [
+    "BOOKING_WINDOW",
+    "FINISHED_STATUSES",
+    "Order",
+    "OrderArchive",
+    "OrderDetails",
+    "OrderStatus",
+    "ORDER_TRANSITIONS",
+]
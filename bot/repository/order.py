@@ -1,20 +1,110 @@
-from datetime import datetime
-from typing import List
+from datetime import date, datetime, time, timedelta
+from functools import partial
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
-from sqlalchemy import asc, desc, select
+from sqlalchemy import (
+    asc,
+    ColumnElement,
+    delete,
+    desc,
+    exists,
+    FromClause,
+    func,
+    insert,
+    Select,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from cache import OrderCounters
 from database import DefaultDatabase
-from models import Order, OrderStatus
+from models import (
+    BOOKING_WINDOW,
+    FINISHED_STATUSES,
+    Order,
+    ORDER_TRANSITIONS,
+    OrderArchive,
+    OrderDetails,
+    OrderStatus,
+    User,
+)
+
+
+def details_query(source: FromClause = Order.__table__) -> Select:
+    """``OrderDetails`` columns, in field order, with the author outer-joined.
+
+    ``source`` is ``orders``, ``orders_archive`` or anything with the same
+    columns, such as the rows returned by an ``UPDATE``. Rows map straight
+    onto ``OrderDetails(*row)`` without loading ORM entities.
+    """
+    return select(
+        source.c.id,
+        source.c.author_id,
+        User.username,
+        User.phone_number,
+        source.c.address,
+        source.c.time,
+        source.c.status,
+        source.c.created_at,
+    ).outerjoin(User, User.id == source.c.author_id)
+
+
+def list_query(pending_only: bool = False, include_archive: bool = False, author_id: Optional[str] = None) -> Select:
+    """Pending orders by time, or all orders newest first, optionally with archived ones.
+
+    ``author_id`` limits the list to the orders of one author.
+    """
+
+    def of_author(source: FromClause) -> Select:
+        stmt = details_query(source)
+        return stmt if author_id is None else stmt.filter(source.c.author_id == author_id)
+
+    if pending_only:
+        return of_author(Order.__table__).filter(*pending_criteria()).order_by(asc(Order.time), asc(Order.id))
+    if include_archive:
+        orders = union_all(of_author(Order.__table__), of_author(OrderArchive.__table__)).subquery()
+        return select(*orders.c).order_by(desc(orders.c.id))
+    return of_author(Order.__table__).order_by(desc(Order.id))
+
+
+def pending_criteria() -> Tuple[ColumnElement[bool], ...]:
+    """All pending orders, however old: the status counters include them too.
+
+    Orders cannot be booked past the booking window, so its end only lets
+    Postgres prune the ``orders`` partitions beyond it.
+    """
+    today = datetime.combine(date.today(), time.min)
+    return (
+        Order.status == OrderStatus.pending,
+        Order.time < today + BOOKING_WINDOW + timedelta(days=1),
+    )
+
+
+T = TypeVar("T")
 
 
 class OrderRepository:
     """Order Repository class"""
 
-    def __init__(self, database: DefaultDatabase):
+    def __init__(self, database: DefaultDatabase, counters: Optional[OrderCounters] = None):
         self.db = database
+        self.counters = counters
+
+    async def _changed(
+        self,
+        session: AsyncSession,
+        old: Optional[OrderStatus],
+        new: Optional[OrderStatus],
+        amount: int = 1,
+    ) -> None:
+        # Counted after the commit, so that a rolled back unit of work leaves the counters alone
+        if self.counters is not None:
+            await self.db.on_commit(session, partial(self.counters.changed, old, new, amount))
 
     async def create(self, author_id: str, address: str, time: datetime, status: OrderStatus) -> int:
         async with self.db.get_session() as session:
@@ -22,11 +112,12 @@ class OrderRepository:
             order = Order(author_id=author_id, address=address, time=time, status=status)
             session.add(order)
             try:
-                await session.commit()
+                await self.db.commit(session)
+                await self._changed(session, None, status)
                 return order.id
 
             except IntegrityError as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise IntegrityError(
                     statement=e.statement,
                     params=e.params,
@@ -34,7 +125,7 @@ class OrderRepository:
                 )
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
     async def get_one(self, id: int) -> Order:
@@ -46,11 +137,24 @@ class OrderRepository:
                     raise NoResultFound(f"Order with id={id} does not exist")
                 return order
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
-    async def get(self) -> List[Order]:
+    async def get_details(self, id: int) -> OrderDetails:
         async with self.db.get_session() as session:
+            session: AsyncSession
+            try:
+                row = (await session.execute(details_query().filter(Order.id == id))).tuples().first()
+                if row is None:
+                    raise NoResultFound(f"Order with id={id} does not exist")
+                return OrderDetails(*row)
+
+            except Exception as e:
+                await self.db.rollback(session)
+                raise e
+
+    async def get(self) -> List[Order]:
+        async with self.db.get_read_session() as session:
             session: AsyncSession
             try:
                 stmt = select(Order).order_by(desc(Order.id))
@@ -58,11 +162,11 @@ class OrderRepository:
 
                 return list(result.scalars().all())
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
     async def get_with_author(self) -> List[Order]:
-        async with self.db.get_session() as session:
+        async with self.db.get_read_session() as session:
             session: AsyncSession
             try:
                 stmt = select(Order).options(joinedload(Order.author)).order_by(desc(Order.id))
@@ -71,16 +175,16 @@ class OrderRepository:
                 return list(result.scalars().all())
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
     async def get_pending(self) -> List[Order]:
-        async with self.db.get_session() as session:
+        async with self.db.get_read_session() as session:
             session: AsyncSession
             try:
                 stmt = (
                     select(Order)
-                    .filter(Order.status == OrderStatus.pending)
+                    .filter(*pending_criteria())
                     .options(joinedload(Order.author))
                     .order_by(asc(Order.time))
                 )
@@ -89,20 +193,106 @@ class OrderRepository:
                 return list(result.scalars().all())
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
-    async def get_by_author(self, author_id: str) -> List[Order]:
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        backward: bool = False,
+    ) -> Tuple[List[OrderDetails], bool]:
+        """Keyset page of all orders, newest first.
+
+        Returns the page and whether more rows follow in the requested direction.
+        """
         async with self.db.get_session() as session:
             session: AsyncSession
             try:
-                stmt = select(Order).filter(Order.author_id == author_id).order_by(desc(Order.id))
-                result = await session.execute(stmt)
+                stmt = details_query()
+                if backward:
+                    stmt = stmt.filter(Order.id > cursor).order_by(asc(Order.id))
+                else:
+                    if cursor is not None:
+                        stmt = stmt.filter(Order.id < cursor)
+                    stmt = stmt.order_by(desc(Order.id))
+                result = await session.execute(stmt.limit(limit + 1))
 
-                return list(result.scalars().all())
+                return self._page([OrderDetails(*row) for row in result.tuples()], limit, backward)
+
+            except Exception as e:
+                await self.db.rollback(session)
+                raise e
+
+    async def get_pending_page(
+        self,
+        limit: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        backward: bool = False,
+    ) -> Tuple[List[OrderDetails], bool]:
+        """Keyset page of pending orders ordered by (time, id).
+
+        Returns the page and whether more rows follow in the requested direction.
+        """
+        async with self.db.get_session() as session:
+            session: AsyncSession
+            try:
+                key = tuple_(Order.time, Order.id)
+                stmt = details_query().filter(*pending_criteria())
+                if backward:
+                    stmt = stmt.filter(key < tuple_(*cursor)).order_by(desc(Order.time), desc(Order.id))
+                else:
+                    if cursor is not None:
+                        stmt = stmt.filter(key > tuple_(*cursor))
+                    stmt = stmt.order_by(asc(Order.time), asc(Order.id))
+                result = await session.execute(stmt.limit(limit + 1))
+
+                return self._page([OrderDetails(*row) for row in result.tuples()], limit, backward)
+
+            except Exception as e:
+                await self.db.rollback(session)
+                raise e
+
+    @staticmethod
+    def _page(orders: List[T], limit: int, backward: bool) -> Tuple[List[T], bool]:
+        has_more = len(orders) > limit
+        orders = orders[:limit]
+        if backward:
+            orders.reverse()
+        return orders, has_more
+
+    async def stream_export(
+        self,
+        pending_only: bool = False,
+        batch_size: int = 1000,
+        include_archive: bool = False,
+    ) -> AsyncIterator[OrderDetails]:
+        """Stream orders through a server-side cursor, ``batch_size`` at a time."""
+        async with self.db.get_read_session() as session:
+            session: AsyncSession
+            stmt = list_query(pending_only, include_archive).execution_options(yield_per=batch_size)
+
+            try:
+                result = await session.stream(stmt)
+                async for partition in result.tuples().partitions():
+                    for row in partition:
+                        yield OrderDetails(*row)
+
+            except Exception as e:
+                await self.db.rollback(session)
+                raise e
+
+    async def get_by_author(self, author_id: str, include_archive: bool = False) -> List[OrderDetails]:
+        """The author's orders, newest first, optionally with archived ones."""
+        async with self.db.get_read_session() as session:
+            session: AsyncSession
+            try:
+                result = await session.execute(list_query(include_archive=include_archive, author_id=author_id))
+
+                return [OrderDetails(*row) for row in result.tuples()]
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
     async def update_status(self, id: int, status: OrderStatus) -> Order:
@@ -113,14 +303,194 @@ class OrderRepository:
                 if not order:
                     raise NoResultFound(f"Order with id={id} does not exist")
 
+                old = order.status
                 order.status = status
-                await session.commit()
+                await self.db.commit(session)
+                await self._changed(session, old, status)
                 await session.refresh(order)
 
                 return order
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
+                raise e
+
+    async def transition(self, id: int, status: OrderStatus, sources: Iterable[OrderStatus]) -> OrderDetails:
+        """Move the order to ``status`` if it is currently in one of ``sources``.
+
+        A single ``UPDATE ... RETURNING`` statement that also returns the author's contacts.
+        """
+        orders = await self._transition(status, Order.id == id, Order.status.in_(list(sources)))
+        if not orders:
+            raise NoResultFound(f"Order with id={id} does not exist or cannot become {status.value}")
+        return orders[0]
+
+    async def bulk_update_status(
+        self,
+        ids: Sequence[int],
+        status: OrderStatus,
+        sources: Iterable[OrderStatus],
+    ) -> List[OrderDetails]:
+        """Move every listed order that is in one of ``sources`` to ``status`` in one statement."""
+        if not ids:
+            return []
+        return await self._transition(status, Order.id.in_(list(ids)), Order.status.in_(list(sources)))
+
+    async def bulk_update_status_on(
+        self,
+        day: date,
+        status: OrderStatus,
+        sources: Iterable[OrderStatus],
+    ) -> List[OrderDetails]:
+        """Move every order booked for ``day`` that is in one of ``sources`` to ``status``."""
+        start = datetime.combine(day, time.min)
+        return await self._transition(
+            status,
+            Order.time >= start,
+            Order.time < start + timedelta(days=1),
+            Order.status.in_(list(sources)),
+        )
+
+    async def cancel(self, author_id: str, id: Optional[int] = None) -> OrderDetails:
+        """Cancel the author's order ``id``, or their latest active one when no id is given.
+
+        One conditional ``UPDATE``; the latest order is picked by a ``LIMIT 1`` subquery,
+        so the cost does not depend on the length of the author's history.
+        """
+        sources = list(ORDER_TRANSITIONS[OrderStatus.canceled])
+        if id is None:
+            latest = (
+                select(Order.id)
+                .where(Order.author_id == author_id, Order.status.in_(sources))
+                .order_by(desc(Order.id))
+                .limit(1)
+                .scalar_subquery()
+            )
+            criteria = Order.id == latest
+        else:
+            criteria = Order.id == id
+
+        orders = await self._transition(
+            OrderStatus.canceled,
+            criteria,
+            Order.author_id == author_id,
+            Order.status.in_(sources),
+        )
+        if not orders:
+            raise NoResultFound(f"User with id={author_id} has no active order to cancel")
+        return orders[0]
+
+    async def archive(self, before: datetime, batch_size: int) -> int:
+        """Move up to ``batch_size`` finished orders booked before ``before`` to the archive.
+
+        On Postgres a single ``WITH moved AS (DELETE ... RETURNING) INSERT ... SELECT``
+        statement, so a batch is either moved completely or not at all.
+        Moved orders are taken off the status counters. Returns the number of moved orders.
+        """
+        columns = ("id", "author_id", "address", "time", "status", "created_at")
+        criteria = (Order.status.in_(list(FINISHED_STATUSES)), Order.time < before)
+        batch = select(Order.id).where(*criteria).order_by(Order.id).limit(batch_size).with_for_update(skip_locked=True)
+
+        async with self.db.get_session() as session:
+            session: AsyncSession
+            try:
+                if session.get_bind().dialect.name == "postgresql":
+                    moved = (
+                        delete(Order)
+                        .where(Order.id.in_(batch.scalar_subquery()), *criteria)
+                        .returning(*(getattr(Order, column) for column in columns))
+                        .cte("moved")
+                    )
+                    stmt = (
+                        insert(OrderArchive)
+                        .from_select(columns, select(*(moved.c[column] for column in columns)))
+                        .returning(OrderArchive.status)
+                    )
+                    statuses = list((await session.execute(stmt)).scalars())
+                else:
+                    # SQLite has no data-modifying CTEs: copy and delete the same ids in one transaction
+                    previous = dict((await session.execute(batch.add_columns(Order.status))).tuples().all())
+                    if previous:
+                        ids = list(previous)
+                        rows = select(*(getattr(Order, column) for column in columns)).where(Order.id.in_(ids))
+                        await session.execute(insert(OrderArchive).from_select(columns, rows))
+                        await session.execute(delete(Order).where(Order.id.in_(ids)))
+                    statuses = list(previous.values())
+                await self.db.commit(session)
+
+                removed: Dict[OrderStatus, int] = {}
+                for old in statuses:
+                    removed[old] = removed.get(old, 0) + 1
+                for old, amount in removed.items():
+                    await self._changed(session, old, None, amount)
+
+                return len(statuses)
+
+            except Exception as e:
+                await self.db.rollback(session)
+                raise e
+
+    async def count_by_status(self) -> Dict[OrderStatus, int]:
+        async with self.db.get_session() as session:
+            session: AsyncSession
+            try:
+                stmt = select(Order.status, func.count()).group_by(Order.status)
+                return dict((await session.execute(stmt)).tuples().all())
+
+            except Exception as e:
+                await self.db.rollback(session)
+                raise e
+
+    async def has_pending(self) -> bool:
+        async with self.db.get_session() as session:
+            session: AsyncSession
+            try:
+                return bool(await session.scalar(select(exists().where(*pending_criteria()))))
+
+            except Exception as e:
+                await self.db.rollback(session)
+                raise e
+
+    async def _transition(self, status: OrderStatus, *criteria: ColumnElement[bool]) -> List[OrderDetails]:
+        async with self.db.get_session() as session:
+            session: AsyncSession
+            try:
+                if session.get_bind().dialect.name == "postgresql":
+                    # The rows are locked first, so the statuses read with them are the ones being replaced
+                    locked = select(Order.id, Order.status).where(*criteria).order_by(Order.id).with_for_update()
+                    locked = locked.cte("locked")
+                    updated = (
+                        update(Order)
+                        .where(Order.id == locked.c.id)
+                        .values(status=status)
+                        .returning(*Order.__table__.c, locked.c.status.label("old_status"))
+                        .cte("updated")
+                    )
+                    stmt = details_query(updated).add_columns(updated.c.old_status)
+                    rows = list((await session.execute(stmt)).tuples())
+                else:
+                    # SQLite has no data-modifying CTEs: the old statuses are read first, the details after
+                    result = await session.execute(select(Order.id, Order.status).where(*criteria))
+                    previous = dict(result.tuples().all())
+                    stmt = update(Order).where(*criteria).values(status=status).returning(Order.id)
+                    ids = list((await session.execute(stmt)).scalars())
+                    result = await session.execute(details_query().filter(Order.id.in_(ids)))
+                    rows = [(*row, previous.get(row[0], status)) for row in result.tuples()]
+                await self.db.commit(session)
+
+                orders = []
+                moved: Dict[OrderStatus, int] = {}
+                for *fields, old in rows:
+                    moved[old] = moved.get(old, 0) + 1
+                    orders.append(OrderDetails(*fields))
+
+                for old, amount in moved.items():
+                    await self._changed(session, old, status, amount)
+
+                return orders
+
+            except Exception as e:
+                await self.db.rollback(session)
                 raise e
 
 
@@ -1,9 +1,12 @@
-from typing import List
+from functools import partial
+from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import exists, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import UserCache
 from database import DefaultDatabase
 from models import User
 
@@ -11,8 +14,15 @@ from models import User
 class UserRepository:
     """User Repository class"""
 
-    def __init__(self, database: DefaultDatabase):
+    def __init__(self, database: DefaultDatabase, cache: Optional[UserCache] = None):
         self.db = database
+        self.cache = cache
+
+    async def _changed(self, session: AsyncSession, user: User) -> User:
+        # Invalidated after the commit, so that no reader caches the old row again
+        if self.cache is not None:
+            await self.db.on_commit(session, partial(self.cache.invalidate, user.id))
+        return user
 
     async def create(self, user_id: str, username: str, is_staff: bool = False, is_superuser: bool = False) -> str:
         async with self.db.get_session() as session:
@@ -25,11 +35,11 @@ class UserRepository:
             )
             session.add(user)
             try:
-                await session.commit()
+                await self.db.commit(session)
                 return user.id
 
             except IntegrityError as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise IntegrityError(
                     statement=e.statement,
                     params=e.params,
@@ -37,7 +47,7 @@ class UserRepository:
                 )
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
     async def get_one(self, id: str) -> User:
@@ -63,7 +73,7 @@ class UserRepository:
                 raise e
 
     async def get(self) -> List[User]:
-        async with self.db.get_session() as session:
+        async with self.db.get_read_session() as session:
             session: AsyncSession
             try:
                 result = (await session.execute(select(User).order_by(User.id))).scalars().all()
@@ -71,6 +81,48 @@ class UserRepository:
             except Exception as e:
                 raise e
 
+    async def upsert_seen(self, id: str, username: str) -> User:
+        """Create the user or refresh its username (in a single statement on Postgres).
+
+        The row is only written when it is new or the username changed; otherwise
+        the existing row is returned from the same snapshot, or read again when
+        it was inserted concurrently.
+        """
+        async with self.db.get_session() as session:
+            session: AsyncSession
+            try:
+                postgres = session.get_bind().dialect.name == "postgresql"
+                stmt = (postgresql.insert if postgres else sqlite.insert)(User).values(id=id, username=username)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[User.id],
+                    set_={"username": stmt.excluded.username},
+                    where=User.username.is_distinct_from(stmt.excluded.username),
+                )
+                if postgres:
+                    seen = stmt.returning(*User.__table__.c).cte("seen")
+                    rows = union_all(
+                        select(seen),
+                        select(User.__table__).where(User.id == id, ~exists(select(seen.c.id))),
+                    )
+                    query = select(User).from_statement(rows)
+                else:
+                    # SQLite has no data-modifying CTEs: upsert, then read the row back
+                    await session.execute(stmt)
+                    query = select(User).where(User.id == id)
+
+                user = (await session.execute(query.execution_options(populate_existing=True))).scalar_one_or_none()
+                if user is None:
+                    # A concurrent transaction inserted the same user after this statement's snapshot was
+                    # taken: the conflict update was skipped and the fallback could not see the row yet
+                    query = select(User).where(User.id == id).execution_options(populate_existing=True)
+                    user = (await session.execute(query)).scalar_one()
+                await self.db.commit(session)
+                return user
+
+            except Exception as e:
+                await self.db.rollback(session)
+                raise e
+
     async def update_username(self, id: str, username: str) -> User:
         async with self.db.get_session() as session:
             session: AsyncSession
@@ -79,12 +131,12 @@ class UserRepository:
                 if user is None:
                     raise NoResultFound(f"User with id={id} does not exist")
                 user.username = username
-                await session.commit()
+                await self.db.commit(session)
                 await session.refresh(user)
-                return user
+                return await self._changed(session, user)
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
     async def update_role(self, id: str, is_staff: bool) -> User:
@@ -95,12 +147,12 @@ class UserRepository:
                 if user is None:
                     raise NoResultFound(f"User with id={id} does not exist")
                 user.is_staff = is_staff
-                await session.commit()
+                await self.db.commit(session)
                 await session.refresh(user)
-                return user
+                return await self._changed(session, user)
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
     async def update_phone_number(self, id: str, phone_number: str) -> User:
@@ -111,12 +163,12 @@ class UserRepository:
                 if user is None:
                     raise NoResultFound(f"User with id={id} does not exist")
                 user.phone_number = phone_number
-                await session.commit()
+                await self.db.commit(session)
                 await session.refresh(user)
-                return user
+                return await self._changed(session, user)
 
             except Exception as e:
-                await session.rollback()
+                await self.db.rollback(session)
                 raise e
 
 
@@ -1,7 +1,10 @@
 import asyncio
 
+from redis.asyncio.client import Redis
+
+from cache import UserCache
 from config import Config, load_config
-from database import PostgresDatabase
+from database import PartitionManager, PostgresDatabase
 from logger import get_logger
 from repository import UserRepository
 from service import UserService
@@ -12,30 +15,63 @@ async def make_user_admin(username: str, make_admin: bool = True) -> None:
     logger = get_logger("main", config.logger)
 
     db = PostgresDatabase(config=config.postgres)
-    user_service = UserService(UserRepository(db), logger=logger)
-    user = await user_service.get_by_username(username=username)
-    if not user:
-        logger.error(f"User with username '{username}' not found.\nPlease ask the user to send a message to the bot!")
-        return
-    if await user_service.update_role(user.id, make_admin):
-        action = "now an admin" if make_admin else "no longer an admin"
-        logger.info(
-            f'User with username "{username}" is {action}.\n'
-            'Please ask the user to restart the bot with the command "/start"',
-        )
-    else:
-        action = "make admin" if make_admin else "revoke admin rights from"
-        logger.error(
-            f'Failed to {action} user with username "{username}"".\n'
-            'Please ask the user to restart the bot with the command "/start"',
-        )
+    redis = Redis(host=config.redis.host, port=config.redis.port, db=config.redis.db)
+    user_cache = UserCache(redis, config.user_cache, logger)
+    user_service = UserService(UserRepository(db, cache=user_cache), logger=logger, cache=user_cache)
+    try:
+        user = await user_service.get_by_username(username=username)
+        if not user:
+            logger.error(
+                f"User with username '{username}' not found.\nPlease ask the user to send a message to the bot!",
+            )
+            return
+        if await user_service.update_role(user.id, make_admin):
+            action = "now an admin" if make_admin else "no longer an admin"
+            logger.info(
+                f'User with username "{username}" is {action}.\n'
+                'Please ask the user to restart the bot with the command "/start"',
+            )
+        else:
+            action = "make admin" if make_admin else "revoke admin rights from"
+            logger.error(
+                f'Failed to {action} user with username "{username}"".\n'
+                'Please ask the user to restart the bot with the command "/start"',
+            )
+    finally:
+        await redis.aclose()
+        await db.close()
+
+
+async def maintain_partitions(months_ahead: int, detach_after: int | None = None) -> None:
+    config: Config = load_config()
+    logger = get_logger("main", config.logger)
+
+    db = PostgresDatabase(config=config.postgres)
+    partitions = PartitionManager(db, logger)
+    try:
+        created = await partitions.create_ahead(months_ahead)
+        logger.info(f"Created {len(created)} order partitions.")
+        if detach_after is not None:
+            detached = await partitions.detach_older_than(detach_after)
+            logger.info(f"Detached {len(detached)} order partitions.")
+    finally:
+        await db.close()
 
 
 if __name__ == "__main__":
-    choice = input("Choose action:\n1. Make user admin\n2. Revoke admin rights\n\nEnter choice (1/2): ")
-    username = input("Enter username: ")
+    choice = input(
+        "Choose action:\n1. Make user admin\n2. Revoke admin rights\n3. Maintain order partitions\n\n"
+        "Enter choice (1/2/3): ",
+    )
+    if choice == "3":
+        months_ahead = int(input("Create partitions for how many months ahead? ") or 12)
+        detach_after = input("Detach partitions older than how many months (empty to keep all)? ")
+
+        asyncio.run(maintain_partitions(months_ahead, int(detach_after) if detach_after else None))
+    else:
+        username = input("Enter username: ")
 
-    asyncio.run(make_user_admin(username, choice == "1"))
+        asyncio.run(make_user_admin(username, choice == "1"))
 
 
 __all__ = []
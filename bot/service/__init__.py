@@ -1,5 +1,6 @@
 from service.order import OrderService
+from service.singleflight import SingleFlight
 from service.user import UserService
 
 
-__all__ = ["UserService", "OrderService"]
+__all__ = ["UserService", "OrderService", "SingleFlight"]
@@ -1,11 +1,18 @@
-from datetime import datetime
+import asyncio
+from datetime import date, datetime, timedelta
 from logging import Logger
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, IO, List, Optional, Sequence, Tuple
 
 from sqlalchemy.exc import NoResultFound
 
-from models import Order, OrderStatus
+from config import OrderArchiveConfig
+from models import Order, ORDER_TRANSITIONS, OrderDetails, OrderStatus
 from repository import OrderRepository
+from service.singleflight import SingleFlight
+from utils import spool_csv
+
+
+EXPORT_HEADER = ["ID", "User ID", "Username", "Phone", "Address", "Order Time", "Status", "Created At"]
 
 
 class OrderService:
@@ -18,6 +25,7 @@ class OrderService:
     ):
         self.repo = repository
         self.log = logger
+        self.flights: SingleFlight[tuple, Order | OrderDetails] = SingleFlight(scope=repository.db.current_session)
 
     async def create(self, author_id: str, address: str, time: datetime, status: str = "pending") -> Optional[int]:
         try:
@@ -30,7 +38,18 @@ class OrderService:
 
     async def get_one(self, id: int) -> Optional[Order]:
         try:
-            return await self.repo.get_one(id)
+            return await self.flights.do(("get_one", id), lambda: self.repo.get_one(id))
+
+        except NoResultFound as e:
+            self.log.warning("OrderRepository: %s" % e)
+        except Exception as e:
+            self.log.error("OrderRepository: %s" % e)
+
+        return None
+
+    async def get_details(self, id: int) -> Optional[OrderDetails]:
+        try:
+            return await self.flights.do(("get_details", id), lambda: self.repo.get_details(id))
 
         except NoResultFound as e:
             self.log.warning("OrderRepository: %s" % e)
@@ -59,9 +78,60 @@ class OrderService:
 
         return []
 
-    async def get_by_author(self, author_id: str) -> List[Order]:
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        backward: bool = False,
+    ) -> Tuple[List[OrderDetails], bool]:
+        try:
+            return await self.repo.get_page(limit, cursor, backward)
+
+        except Exception as e:
+            self.log.error("OrderRepository: %s" % e)
+
+        return [], False
+
+    async def get_pending_page(
+        self,
+        limit: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        backward: bool = False,
+    ) -> Tuple[List[OrderDetails], bool]:
+        try:
+            return await self.repo.get_pending_page(limit, cursor, backward)
+
+        except Exception as e:
+            self.log.error("OrderRepository: %s" % e)
+
+        return [], False
+
+    async def export_csv(self, pending_only: bool = False, include_archive: bool = False) -> Optional[IO[bytes]]:
+        """Stream orders into a CSV file; the caller closes the returned file."""
         try:
-            return await self.repo.get_by_author(author_id)
+            return await spool_csv(self._export_rows(pending_only, include_archive), EXPORT_HEADER)
+
+        except Exception as e:
+            self.log.error("OrderRepository: %s" % e)
+
+        return None
+
+    async def _export_rows(self, pending_only: bool, include_archive: bool) -> AsyncIterator[Sequence[Any]]:
+        async for row in self.repo.stream_export(pending_only, include_archive=include_archive):
+            yield (
+                row.id,
+                row.author_id,
+                f"@{row.username}" if row.username else "",
+                row.phone_number or "",
+                row.address,
+                row.time.strftime("%Y-%m-%d %H:%M:%S"),
+                row.status.value,
+                row.created_at.strftime("%Y-%m-%d %H:%M:%S") if row.created_at else "",
+            )
+
+    async def get_by_author(self, author_id: str, include_archive: bool = False) -> List[OrderDetails]:
+        try:
+            return await self.repo.get_by_author(author_id, include_archive)
 
         except Exception as e:
             self.log.error("OrderRepository: %s" % e)
@@ -79,9 +149,111 @@ class OrderService:
 
         return None
 
+    async def transition(self, id: int, status: str, force: bool = False) -> Optional[OrderDetails]:
+        """Change the status only along ``ORDER_TRANSITIONS``, or from any status when ``force`` is set."""
+        try:
+            new_status = OrderStatus(status)
+            sources = list(OrderStatus) if force else ORDER_TRANSITIONS.get(new_status, frozenset())
+            return await self.repo.transition(id, new_status, sources)
+
+        except NoResultFound as e:
+            self.log.warning("OrderRepository: %s" % e)
+        except Exception as e:
+            self.log.error("OrderRepository: %s" % e)
+
+        return None
+
+    async def cancel(self, author_id: str, id: Optional[int] = None) -> Optional[OrderDetails]:
+        try:
+            return await self.repo.cancel(author_id, id)
+
+        except NoResultFound as e:
+            self.log.warning("OrderRepository: %s" % e)
+        except Exception as e:
+            self.log.error("OrderRepository: %s" % e)
+
+        return None
+
+    async def bulk_update_status(self, ids: Sequence[int], status: str) -> List[OrderDetails]:
+        try:
+            new_status = OrderStatus(status)
+            sources = ORDER_TRANSITIONS.get(new_status, frozenset())
+            return await self.repo.bulk_update_status(ids, new_status, sources)
+
+        except Exception as e:
+            self.log.error("OrderRepository: %s" % e)
+
+        return []
+
+    async def bulk_update_status_on(self, day: date, status: str) -> List[OrderDetails]:
+        try:
+            new_status = OrderStatus(status)
+            sources = ORDER_TRANSITIONS.get(new_status, frozenset())
+            return await self.repo.bulk_update_status_on(day, new_status, sources)
+
+        except Exception as e:
+            self.log.error("OrderRepository: %s" % e)
+
+        return []
+
+    async def count_by_status(self) -> Optional[Dict[OrderStatus, int]]:
+        """Counters kept in Redis; ``None`` when they are unavailable."""
+        if self.repo.counters is None:
+            return None
+        return await self.repo.counters.get()
+
+    async def reconcile_counters(self, interval: int) -> None:
+        """Periodically replace the status counters with a ``GROUP BY status`` count."""
+        if self.repo.counters is None:
+            return
+
+        while True:
+            try:
+                await self.repo.counters.reconcile(self.repo.count_by_status)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.log.error("OrderRepository: %s" % e)
+
+            await asyncio.sleep(interval)
+
+    async def archive_finished(self, config: OrderArchiveConfig) -> int:
+        """Move finished orders older than ``config.after_days`` to the archive, batch by batch."""
+        before = datetime.now() - timedelta(days=config.after_days)
+        total = 0
+        while True:
+            moved = await self.repo.archive(before, config.batch_size)
+            total += moved
+            if moved < config.batch_size:
+                return total
+            await asyncio.sleep(config.pause)
+
+    async def run_archiver(self, config: OrderArchiveConfig) -> None:
+        """Archive finished orders every ``config.interval`` seconds; disabled when ``after_days`` is 0."""
+        if config.after_days <= 0:
+            return
+
+        while True:
+            try:
+                total = await self.archive_finished(config)
+                if total:
+                    self.log.info("OrderService: archived %d orders" % total)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.log.error("OrderRepository: %s" % e)
+
+            await asyncio.sleep(config.interval)
+
     async def check_pending(self) -> bool:
+        counts = await self.count_by_status()
+        if counts is not None:
+            return counts[OrderStatus.pending] > 0
+
         try:
-            return bool(await self.repo.get_pending())
+            return await self.repo.has_pending()
 
         except Exception as e:
             self.log.error("OrderRepository: %s" % e)
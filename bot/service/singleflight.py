@@ -0,0 +1,46 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[K, T]):
+    """Coalesces concurrent calls for the same key into one in-flight call.
+
+    The shared call runs as a separate task, so a cancelled caller does not
+    cancel it for the others. Results are not kept once the call completes.
+    Calls only coalesce within the same ``scope()``, e.g. the unit of work
+    session, so that callers never get objects bound to another session.
+    """
+
+    def __init__(self, scope: Optional[Callable[[], Hashable]] = None):
+        self.scope = scope
+        self._flights: Dict[Hashable, asyncio.Task[T]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": self.in_flight}
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        flight: Hashable = key if self.scope is None else (self.scope(), key)
+
+        task = self._flights.get(flight)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._flights[flight] = task
+            task.add_done_callback(lambda _: self._flights.pop(flight, None))
+
+        return await asyncio.shield(task)
+
+
+__all__ = ["SingleFlight"]
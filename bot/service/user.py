@@ -3,8 +3,10 @@ from typing import Optional
 
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
+from cache import UserCache
 from models import User
 from repository import UserRepository
+from service.singleflight import SingleFlight
 
 
 class UserService:
@@ -14,9 +16,22 @@ class UserService:
         self,
         repository: UserRepository,
         logger: Logger,
+        cache: Optional[UserCache] = None,
     ):
         self.repo = repository
         self.log = logger
+        self.cache = cache
+        self.flights: SingleFlight[tuple, Optional[User]] = SingleFlight(scope=repository.db.current_session)
+
+    async def _cached(self, id: str) -> Optional[User]:
+        if self.cache is None:
+            return None
+        return await self.cache.get(id)
+
+    async def _remember(self, user: Optional[User]) -> Optional[User]:
+        if self.cache is not None and user is not None:
+            await self.cache.set(user)
+        return user
 
     async def create(self, id: str, username: str, is_staff: bool = False) -> str:
         try:
@@ -41,14 +56,21 @@ class UserService:
         return None
 
     async def get_or_create(self, id: str, username: str) -> Optional[User]:
+        cached = await self._cached(id)
+        if cached is not None:
+            return cached
+
+        return await self.flights.do(("get_or_create", id), lambda: self._get_or_create(id, username))
+
+    async def _get_or_create(self, id: str, username: str) -> Optional[User]:
         try:
             try:
-                return await self.repo.get_one(id)
+                return await self._remember(await self.repo.get_one(id))
 
             except NoResultFound:
                 try:
                     id = await self.create(id, username)
-                    return await self.repo.get_one(id)
+                    return await self._remember(await self.repo.get_one(id))
                 except Exception as e:
                     self.log.error("UserRepository: %s" % e)
 
@@ -61,6 +83,22 @@ class UserService:
 
         return None
 
+    async def upsert_seen(self, id: str, username: str) -> Optional[User]:
+        cached = await self._cached(id)
+        if cached is not None and cached.username == username:
+            return cached
+
+        try:
+            return await self.flights.do(("upsert_seen", id, username), lambda: self._upsert_seen(id, username))
+
+        except Exception as e:
+            self.log.error("UserRepository: %s" % e)
+
+        return None
+
+    async def _upsert_seen(self, id: str, username: str) -> Optional[User]:
+        return await self._remember(await self.repo.upsert_seen(id, username))
+
     async def get_by_username(self, username: str) -> Optional[User]:
         try:
             return await self.repo.get_by_username(username)
@@ -0,0 +1,6 @@
+from utils import templates
+from utils.export import spool_csv, SpooledInputFile
+from utils.messages import edit_or_send
+
+
+__all__ = ["edit_or_send", "spool_csv", "SpooledInputFile", "templates"]
@@ -0,0 +1,56 @@
+import csv
+import io
+import tempfile
+from typing import Any, AsyncGenerator, AsyncIterable, IO, Iterable, Sequence
+
+from aiogram import Bot
+from aiogram.types import InputFile
+
+
+SPOOL_MAX_MEMORY = 1024 * 1024
+
+
+async def spool_csv(
+    rows: AsyncIterable[Sequence[Any]],
+    header: Iterable[str],
+    max_memory: int = SPOOL_MAX_MEMORY,
+) -> IO[bytes]:
+    """Encode rows as UTF-8 CSV into a file that moves to disk past ``max_memory`` bytes.
+
+    The returned file is positioned at the start; the caller owns and closes it.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory, mode="w+b")
+    try:
+        text = io.TextIOWrapper(spool, encoding="utf-8", newline="")  # type: ignore
+        writer = csv.writer(text)
+        writer.writerow(header)
+        async for row in rows:
+            writer.writerow(row)
+
+        text.flush()
+        text.detach()
+        spool.seek(0)
+        return spool  # type: ignore
+
+    except BaseException:
+        spool.close()
+        raise
+
+
+class SpooledInputFile(InputFile):
+    """Uploads an already written file object chunk by chunk.
+
+    The file is not closed here; the caller owns it.
+    """
+
+    def __init__(self, file: IO[bytes], filename: str, chunk_size: int = 64 * 1024):
+        super().__init__(filename=filename, chunk_size=chunk_size)
+        self.file = file
+
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
+        self.file.seek(0)
+        while chunk := self.file.read(self.chunk_size):
+            yield chunk
+
+
+__all__ = ["spool_csv", "SpooledInputFile"]
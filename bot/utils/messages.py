@@ -0,0 +1,46 @@
+from typing import Optional
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import InlineKeyboardMarkup, MaybeInaccessibleMessageUnion, Message
+
+
+def same_markup(message: Message, reply_markup: Optional[InlineKeyboardMarkup]) -> bool:
+    if message.reply_markup is None or reply_markup is None:
+        return message.reply_markup is reply_markup
+    return message.reply_markup.model_dump() == reply_markup.model_dump()
+
+
+async def edit_or_send(
+    message: Optional[MaybeInaccessibleMessageUnion],
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+) -> Optional[Message]:
+    """Show ``text`` and ``reply_markup`` in place of the bot's ``message``.
+
+    Only the keyboard is edited when the text is unchanged, and nothing is
+    sent when neither changed. A new message is sent when the old one cannot
+    be edited (it is inaccessible, has no text or was deleted).
+    """
+    if message is None:
+        return None
+
+    if isinstance(message, Message) and message.text is not None:
+        text_changed = message.html_text != text
+        if not text_changed and same_markup(message, reply_markup):
+            return message
+
+        try:
+            if text_changed:
+                edited = await message.edit_text(text, reply_markup=reply_markup)
+            else:
+                edited = await message.edit_reply_markup(reply_markup=reply_markup)
+            return edited if isinstance(edited, Message) else message
+
+        except TelegramBadRequest as e:
+            if "message is not modified" in e.message:
+                return message
+
+    return await message.answer(text, reply_markup=reply_markup)
+
+
+__all__ = ["edit_or_send"]
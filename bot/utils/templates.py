@@ -0,0 +1,186 @@
+from datetime import datetime
+from html import escape
+from typing import Dict, Iterable, Optional
+
+from models import OrderDetails, OrderStatus
+
+# Messages are sent with parse_mode=HTML: everything typed by users (addresses,
+# names) goes through quote(). Static parts and per-status fragments are built
+# once at import.
+
+ADDRESS_PREVIEW_LENGTH = 50
+
+STATUS_EMOJI: Dict[str, str] = {
+    OrderStatus.pending.value: "⏳",
+    OrderStatus.accepted.value: "✅",
+    OrderStatus.completed.value: "🎉",
+    OrderStatus.rejected.value: "❌",
+    OrderStatus.canceled.value: "🚫",
+}
+STATUS_TEXT: Dict[str, str] = {
+    OrderStatus.pending.value: "В ожидании",
+    OrderStatus.accepted.value: "Принят",
+    OrderStatus.completed.value: "Выполнен",
+    OrderStatus.rejected.value: "Отклонён",
+    OrderStatus.canceled.value: "Отменён",
+}
+
+# Хвост строки списка и строка статуса в карточке заявки
+ROW_STATUS = {status: f"📊 Статус: {text}\n\n" for status, text in STATUS_TEXT.items()}
+CARD_STATUS = {status: f"📊 <b>Статус:</b> {text}\n" for status, text in STATUS_TEXT.items()}
+UNKNOWN_ROW_STATUS = "📊 Статус: Неизвестно\n\n"
+UNKNOWN_CARD_STATUS = "📊 <b>Статус:</b> Неизвестно\n"
+
+# Заголовок и концовка уведомлений клиенту; "reopen" — возврат заявки в работу
+NOTIFICATIONS = {
+    OrderStatus.accepted.value: (
+        "✅ <b>Ваш заказ принят!</b>\n\n",
+        "\nМы свяжемся с вами для уточнения деталей.",
+    ),
+    OrderStatus.completed.value: (
+        "🎉 <b>Ваш заказ выполнен!</b>\n\n",
+        "\nСпасибо за использование наших услуг!",
+    ),
+    OrderStatus.rejected.value: (
+        "❌ <b>Ваш заказ отклонен</b>\n\n",
+        "\nК сожалению, мы не можем выполнить ваш заказ.\nВы можете оформить новый заказ с другими параметрами.",
+    ),
+    "reopen": (
+        "🔄 <b>Ваш заказ возвращен в работу</b>\n\n",
+        "\nМы свяжемся с вами для уточнения деталей.",
+    ),
+}
+
+DATE_STEP = "📅 <b>Шаг 2 из 3: Дата</b>\n\nАдрес: <i>{address}</i>\n\nВыберите удобную дату для уборки:"
+TIME_STEP = (
+    "🕐 <b>Шаг 3 из 3: Время</b>\n\n"
+    "Адрес: <i>{address}</i>\n"
+    "Дата: <i>{date}</i>\n\n"
+    "Выберите удобное время для уборки:"
+)
+CONFIRMATION = (
+    "✅ <b>Подтверждение заказа</b>\n\n"
+    "📍 <b>Адрес:</b> {address}\n"
+    "📅 <b>Дата:</b> {date}\n"
+    "🕐 <b>Время:</b> {time}\n\n"
+    "Подтвердите заказ или вернитесь для изменения данных:"
+)
+ORDER_CREATED = (
+    "🎉 <b>Спасибо! Ваш заказ принят.</b>\n\n"
+    "📍 <b>Адрес:</b> {address}\n"
+    "📅 <b>Дата:</b> {date}\n"
+    "🕐 <b>Время:</b> {time}\n\n"
+    "✅ Мы свяжемся с вами в ближайшее время для уточнения деталей."
+)
+
+
+def quote(value: str) -> str:
+    """Экранирование пользовательского текста для parse_mode=HTML"""
+    # Большинство адресов и имён экранировать не нужно
+    if "&" in value or "<" in value or ">" in value:
+        return escape(value, quote=False)
+    return value
+
+
+def status_emoji(status: str) -> str:
+    return STATUS_EMOJI.get(status, "❓")
+
+
+def status_text(status: str) -> str:
+    return STATUS_TEXT.get(status, "Неизвестно")
+
+
+def format_time(value: datetime) -> str:
+    """Дата в формате %d.%m.%Y %H:%M (в несколько раз быстрее strftime)"""
+    return f"{value.day:02}.{value.month:02}.{value.year} {value.hour:02}:{value.minute:02}"
+
+
+def date_step(address: str) -> str:
+    return DATE_STEP.format(address=quote(address))
+
+
+def time_step(address: str, date: str) -> str:
+    return TIME_STEP.format(address=quote(address), date=date)
+
+
+def confirmation(address: str, date: str, time: str) -> str:
+    return CONFIRMATION.format(address=quote(address), date=date, time=time)
+
+
+def order_created(address: str, date: str, time: str) -> str:
+    return ORDER_CREATED.format(address=quote(address), date=date, time=time)
+
+
+def author_info(order: OrderDetails, phone_placeholder: Optional[str] = None) -> str:
+    info = f"ID: {order.author_id}"
+    if order.username:
+        info += f" (@{quote(order.username)})"
+    phone = order.phone_number or phone_placeholder
+    if phone:
+        info += f"\n📱 {quote(phone)}"
+    return info
+
+
+def order_row(number: int, order: OrderDetails) -> str:
+    """Строка заявки в списке"""
+    status = order.status.value
+    address = order.address
+    if len(address) > ADDRESS_PREVIEW_LENGTH:
+        address = address[:ADDRESS_PREVIEW_LENGTH] + "..."
+    return (
+        f"<b>{number}. Заказ #{order.id}</b> {STATUS_EMOJI.get(status, '❓')}\n"
+        f"👤 {author_info(order)}\n"
+        f"📍 {quote(address)}\n"
+        f"📅 {format_time(order.time)}\n"
+        f"{ROW_STATUS.get(status, UNKNOWN_ROW_STATUS)}"
+    )
+
+
+def orders_page(title: str, orders: Iterable[OrderDetails], start: int = 1) -> str:
+    """Страница списка заявок"""
+    return f"{title}\n\n" + "".join(order_row(number, order) for number, order in enumerate(orders, start=start))
+
+
+def order_card(order: OrderDetails) -> str:
+    """Карточка заявки для администратора"""
+    status = order.status.value
+    created = format_time(order.created_at) if order.created_at else "—"
+    return (
+        f"📋 <b>Заказ #{order.id}</b> {status_emoji(status)}\n\n"
+        f"👤 <b>Клиент:</b>\n{author_info(order, 'Не указан')}\n\n"
+        f"📍 <b>Адрес:</b>\n{quote(order.address)}\n\n"
+        f"📅 <b>Дата и время:</b> {format_time(order.time)}\n"
+        f"{CARD_STATUS.get(status, UNKNOWN_CARD_STATUS)}"
+        f"🕐 <b>Создан:</b> {created}\n\n"
+        "Выберите действие:"
+    )
+
+
+def client_notification(order: OrderDetails, status: str) -> Optional[str]:
+    """Уведомление клиента об изменении статуса; None, если о статусе не уведомляют"""
+    parts = NOTIFICATIONS.get(status)
+    if parts is None:
+        return None
+    header, footer = parts
+    return (
+        f"{header}"
+        f"📋 <b>Заказ #{order.id}</b>\n"
+        f"📍 <b>Адрес:</b> {quote(order.address)}\n"
+        f"📅 <b>Дата и время:</b> {format_time(order.time)}\n"
+        f"{footer}"
+    )
+
+
+__all__ = [
+    "client_notification",
+    "confirmation",
+    "date_step",
+    "order_card",
+    "order_created",
+    "order_row",
+    "orders_page",
+    "quote",
+    "status_emoji",
+    "status_text",
+    "time_step",
+]